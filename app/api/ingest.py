@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict, List
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from app.db import db
+from app.utils.validate import validate_participant, validate_problem
+
+router = APIRouter()
+
+
+class BatchUploadRequest(BaseModel):
+    items: List[Dict[str, Any]]
+
+
+def _validate_items(items: List[Dict[str, Any]], validate: Callable) -> List[Dict[str, Any]]:
+    """
+    Validates every item up front so a bad record rejects the whole batch
+    before anything is written.
+    """
+    documents = []
+    for index, item in enumerate(items):
+        try:
+            model = validate(item)
+        except HTTPException as e:
+            raise HTTPException(
+                status_code=422, detail={"index": index, "errors": e.detail}
+            )
+        documents.append(model.model_dump(by_alias=True, exclude_none=True))
+    return documents
+
+
+@router.post("/participants/batch", status_code=201)
+async def upload_participants_batch(request: BatchUploadRequest):
+    """Insert a whole participant list with a single insert_many round trip."""
+    documents = _validate_items(request.items, validate_participant)
+    if documents:
+        await db.participants.insert_many(documents, ordered=False)
+    return {"inserted": len(documents)}
+
+
+@router.post("/problems/batch", status_code=201)
+async def upload_problems_batch(request: BatchUploadRequest):
+    """Insert a whole problem list with a single insert_many round trip."""
+    documents = _validate_items(request.items, validate_problem)
+    if documents:
+        await db.problems.insert_many(documents, ordered=False)
+    return {"inserted": len(documents)}
@@ -9,9 +9,9 @@ from scipy.optimize import linear_sum_assignment
 
 from app.db import db
 from app.llm.openai_client import get_problem_score, get_team_scores, review_phase1_assignments, review_phase2_teams, review_phase3_assignments, analyze_team_role_balance
-from app.matching.cost import compute_individual_cost, DEFAULT_WEIGHTS
+from app.matching.cost import compute_cost_matrix, DEFAULT_WEIGHTS
 from app.matching.pairwise import participant_pair_cost
-from app.matching.team_problem_cost import compute_team_problem_cost
+from app.matching.team_problem_cost import compute_team_problem_cost_sync
 from app.matching.team_vector import TeamVector
 from app.models import Problem
 import numpy as np
@@ -426,29 +426,31 @@ async def build_team_problem_assignment_matrix(
     team_map = {i: teams[i]["team_id"] for i in range(num_teams)}
     problem_map = {i: problems[i]["id"] for i in range(num_problems)}
     
+    # Build each team vector and problem model once, not once per pair
+    team_vectors = [await build_team_vector_from_dict(team) for team in teams]
+    # Problems come from our own collection and were validated at ingest, so
+    # skip pydantic's per-field validation when converting them
+    problem_models = [
+        Problem.model_construct(
+            version="1.0",
+            id=problem["id"],
+            title=problem.get("title", ""),
+            raw_prompt=problem.get("raw_prompt", ""),
+            estimated_team_size=3,
+            preferred_roles=problem.get("role_preferences", {}),
+            required_skills=problem.get("required_skills", {}),
+            role_preferences=problem.get("role_preferences", {}),
+            problem_embedding=problem.get("problem_embedding"),
+            expected_ambiguity=problem.get("expected_ambiguity", 0.5),
+            expected_hours_per_week=problem.get("estimated_hours", 40) // 4
+        )
+        for problem in problems
+    ]
+    
     # Calculate sophisticated team-problem costs
-    for i, team in enumerate(teams):
-        for j, problem in enumerate(problems):
-            # Build team vector
-            team_vector = await build_team_vector_from_dict(team)
-            
-            # Convert problem to Problem model format
-            problem_model = Problem(
-                version="1.0",
-                _id=problem["id"],
-                title=problem.get("title", ""),
-                raw_prompt=problem.get("raw_prompt", ""),
-                estimated_team_size=3,
-                preferred_roles=problem.get("role_preferences", {}),
-                required_skills=problem.get("required_skills", {}),
-                role_preferences=problem.get("role_preferences", {}),
-                problem_embedding=problem.get("problem_embedding"),
-                expected_ambiguity=problem.get("expected_ambiguity", 0.5),
-                expected_hours_per_week=problem.get("estimated_hours", 40) // 4
-            )
-            
-            # Calculate sophisticated cost
-            cost = await compute_team_problem_cost(team_vector, problem_model, PHASE3_WEIGHTS)
+    for i, team_vector in enumerate(team_vectors):
+        for j, problem_model in enumerate(problem_models):
+            cost = compute_team_problem_cost_sync(team_vector, problem_model, PHASE3_WEIGHTS)
             cost_matrix[i, j] = cost
     
     return cost_matrix, team_map, problem_map
@@ -504,7 +506,8 @@ async def build_team_vector_from_dict(team: Dict[str, Any]) -> TeamVector:
     min_availability = min(availabilities)
     total_availability = sum(availabilities)
     
-    return TeamVector(
+    # Every field is computed right here, so there is nothing to validate
+    return TeamVector.model_construct(
         team_id=team["team_id"],
         avg_skill_levels=avg_skills,
         role_weights=role_weights,
@@ -556,33 +559,36 @@ async def simple_phase1(request: SimplePhase1Request):
         assignments = []
         total_cost = 0.0
 
-        for participant in participants:
-            min_cost = float('inf')
-            best_problem = None
-
-            participant_formatted = {
+        participants_formatted = [
+            {
                 "skills": participant.get("self_rated_skills", {}),
                 "role_preferences": {role: 1.0 for role in participant.get("primary_roles", [])},
                 "motivation_embedding": participant.get("motivation_embedding"),
                 "ambiguity_tolerance": participant.get("ambiguity_tolerance", 0.5),
                 "hours_per_week": participant.get("availability_hours", 20)
             }
-            
-            for problem in processed_problems:
-                problem_formatted = {
-                    "required_skills": problem.get("required_skills", {}),
-                    "role_preferences": problem.get("role_preferences", {}),
-                    "motivation_embedding": problem.get("problem_embedding"),
-                    "expected_ambiguity": problem.get("expected_ambiguity", 0.5),
-                    "expected_hours_per_week": problem.get("estimated_hours", 40) / 4,
-                }
-                
-                cost = compute_individual_cost(participant_formatted, problem_formatted, PHASE1_WEIGHTS)
-                cost += (1.0 - problem.get("problem_score", 0.5)) * 0.3 # Add quality bonus
-                
-                if cost < min_cost:
-                    min_cost = cost
-                    best_problem = problem
+            for participant in participants
+        ]
+        problems_formatted = [
+            {
+                "required_skills": problem.get("required_skills", {}),
+                "role_preferences": problem.get("role_preferences", {}),
+                "motivation_embedding": problem.get("problem_embedding"),
+                "expected_ambiguity": problem.get("expected_ambiguity", 0.5),
+                "expected_hours_per_week": problem.get("estimated_hours", 40) / 4,
+            }
+            for problem in processed_problems
+        ]
+        # All participant x problem costs in one vectorized pass, plus the quality bonus
+        quality_bonus = np.array([(1.0 - problem.get("problem_score", 0.5)) * 0.3 for problem in processed_problems])
+        cost_matrix = compute_cost_matrix(participants_formatted, problems_formatted, PHASE1_WEIGHTS) + quality_bonus
+
+        for i, participant in enumerate(participants):
+            best_problem = None
+            if processed_problems:
+                best_index = int(np.argmin(cost_matrix[i]))
+                best_problem = processed_problems[best_index]
+                min_cost = float(cost_matrix[i, best_index])
             
             if best_problem:
                 assignment = {
@@ -7,6 +7,11 @@ MONGO_DETAILS = os.getenv("MONGO_DETAILS", "mongodb://localhost:27017")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_ENV = os.getenv("PINECONE_ENV", "us-east-1")
+# Directory for persisted participant pair-cost matrices (e.g. ".cache/pair_costs");
+# leave unset to recompute them every matching run.
+PAIR_COST_CACHE_DIR = os.getenv("PAIR_COST_CACHE_DIR")
+# Upper bound on a gzip-encoded request body once inflated (decompression bomb guard)
+MAX_INFLATED_REQUEST_BYTES = int(os.getenv("MAX_INFLATED_REQUEST_BYTES", str(64 * 1024 * 1024)))
 
 # Define the allowed skills for validation
 ALLOWED_SKILLS = [
@@ -18,6 +23,10 @@ ALLOWED_ROLES = [
     "frontend", "backend", "fullstack", "data_science", "devops", "product_manager", "designer"
 ]
 
+# Hashed views of the lists above for O(1) membership checks
+ALLOWED_SKILL_SET = frozenset(ALLOWED_SKILLS)
+ALLOWED_ROLE_SET = frozenset(ALLOWED_ROLES)
+
 STAGE_3_WEIGHTS = {
     "skill_gap": 0.35,
     "role_alignment": 0.20,
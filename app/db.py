@@ -1,7 +1,34 @@
+import asyncio
 import os
 
 from motor.motor_asyncio import AsyncIOMotorClient
 
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
-client: AsyncIOMotorClient = AsyncIOMotorClient(MONGO_URL)
-db = client.nat_ignite_matchmaker 
\ No newline at end of file
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "10"))
+
+# One pooled client per process, shared by the API and the Celery worker. Motor
+# binds it to the first event loop that uses it; the worker runs all of its
+# coroutines on one persistent loop (app.worker.event_loop) for that reason.
+# Compression is negotiated with the server in order of preference (zstd comes
+# from the pymongo[zstd] extra, zlib is always available).
+client: AsyncIOMotorClient = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    compressors="zstd,zlib",
+    retryWrites=True,
+)
+db = client.nat_ignite_matchmaker
+
+
+async def bind_client_to_running_loop() -> None:
+    """
+    Binds `client` to the running event loop, so a process that owns a
+    persistent loop pins the client to it up front. Raises if the client is
+    already bound to a different loop, which would fail later with "Event
+    loop is closed" or "attached to a different loop".
+    """
+    loop = asyncio.get_running_loop()
+    if client.get_io_loop() is not loop:
+        raise RuntimeError("Mongo client is already bound to another event loop")
@@ -1,10 +1,18 @@
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
+from app.api.ingest import router as ingest_router
 from app.api.match import router as match_router
+from app.config import MAX_INFLATED_REQUEST_BYTES
+from app.utils.compression import GzipRequestMiddleware
 
 app = FastAPI()
+# Embedding-heavy JSON compresses well in both directions
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+app.add_middleware(GzipRequestMiddleware, max_body_size=MAX_INFLATED_REQUEST_BYTES)
 
 app.include_router(match_router, prefix="/api")
+app.include_router(ingest_router, prefix="/api")
 
 
 @app.get("/health-check")
@@ -1,15 +1,16 @@
-import asyncio
 from typing import Dict, Tuple
 
 import numpy as np
 
 from app.db import db
-from app.matching.cost import compute_individual_cost
+from app.matching.cost import PARTICIPANT_COST_PROJECTION, PROBLEM_COST_PROJECTION, compute_cost_matrix
 
 
 async def build_individual_problem_matrix() -> Tuple[np.ndarray, Dict[int, str], Dict[int, Tuple[str, int]]]:
-    participants_cursor = db.participants.find({}, {"_id": 1})
-    problems_cursor = db.problems.find({}, {"_id": 1, "estimated_team_size": 1})
+    # One projected query per collection: only the fields the cost model reads
+    # are decoded, rather than whole documents fetched one by one.
+    participants_cursor = db.participants.find({}, PARTICIPANT_COST_PROJECTION)
+    problems_cursor = db.problems.find({}, {**PROBLEM_COST_PROJECTION, "estimated_team_size": 1})
 
     participants_list = await participants_cursor.to_list(length=None)
     problems_list = await problems_cursor.to_list(length=None)
@@ -27,33 +28,13 @@ async def build_individual_problem_matrix() -> Tuple[np.ndarray, Dict[int, str],
     participant_map = {i: pid for i, pid in enumerate(participant_ids)}
     slot_map = {i: slot for i, slot in enumerate(problem_slots)}
     
-    num_participants = len(participant_ids)
-    num_slots = len(problem_slots)
+    # Score each participant against each problem with slots once, then fan
+    # the columns out to that problem's slots.
+    slotted_problems = [p for p in problems_list if p["estimated_team_size"] > 0]
+    problem_column = {p["_id"]: j for j, p in enumerate(slotted_problems)}
+    problem_costs = compute_cost_matrix(participants_list, slotted_problems)
+
+    # Left rectangular: the solver leaves surplus participants or slots unassigned
+    cost_matrix = problem_costs[:, [problem_column[problem_id] for problem_id, _ in problem_slots]]
     
-    cost_matrix = np.full((num_participants, num_slots), np.inf)
-
-    # Fetch all data in parallel
-    participant_docs = await asyncio.gather(
-        *[db.participants.find_one({"_id": pid}) for pid in participant_ids]
-    )
-    problem_docs_map = {
-        p["_id"]: p
-        for p in await db.problems.find(
-            {"_id": {"$in": [s[0] for s in problem_slots]}}
-        ).to_list(length=None)
-    }
-
-    for i, p_doc in enumerate(participant_docs):
-        for j, (problem_id, _) in enumerate(problem_slots):
-            problem_doc = problem_docs_map[problem_id]
-            if p_doc and problem_doc:
-                cost_matrix[i, j] = compute_individual_cost(p_doc, problem_doc)
-            else:
-                cost_matrix[i, j] = np.inf # or some other high value
-
-    # Make the matrix square
-    size = max(num_participants, num_slots)
-    padded_matrix = np.full((size, size), np.max(cost_matrix) * 2 if cost_matrix.size > 0 else 1000)
-    padded_matrix[:num_participants, :num_slots] = cost_matrix
-    
-    return padded_matrix, participant_map, slot_map 
\ No newline at end of file
+    return cost_matrix, participant_map, slot_map 
\ No newline at end of file
@@ -3,7 +3,7 @@ from typing import List, Tuple, Dict
 from app.db import db
 from app.models import Team, Problem, Participant
 from app.matching.team_vector import build_team_vector, TeamVector
-from app.matching.team_problem_cost import compute_team_problem_cost
+from app.matching.team_problem_cost import compute_team_problem_cost_matrix
 from app.config import STAGE_3_WEIGHTS
 
 async def get_all_final_teams() -> List[Team]:
@@ -42,19 +42,10 @@ async def build_team_problem_matrix() -> Tuple[np.ndarray, Dict[int, str], Dict[
             team_vector = await build_team_vector(team, participants)
             team_vectors.append(team_vector)
 
-    num_teams = len(team_vectors)
-    num_problems = len(problems)
-    
-    # Ensure matrix is square for Hungarian algorithm
-    matrix_size = max(num_teams, num_problems)
-    cost_matrix = np.full((matrix_size, matrix_size), 1e6) # High cost for padding
-
     team_map = {i: tv.team_id for i, tv in enumerate(team_vectors)}
     problem_map = {i: str(p.id) for i, p in enumerate(problems)}
 
-    for i, team_vector in enumerate(team_vectors):
-        for j, problem in enumerate(problems):
-            cost = await compute_team_problem_cost(team_vector, problem, STAGE_3_WEIGHTS)
-            cost_matrix[i, j] = cost
+    # Rectangular is fine: the solvers leave surplus teams or problems unassigned
+    cost_matrix = compute_team_problem_cost_matrix(team_vectors, problems, STAGE_3_WEIGHTS)
 
     return cost_matrix, team_map, problem_map 
\ No newline at end of file
@@ -1,7 +1,10 @@
-from typing import Any, Dict, Optional
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-from scipy.spatial.distance import cosine
+
+from app.config import ALLOWED_SKILLS
 
 # Default weights for the cost function terms
 DEFAULT_WEIGHTS = {
@@ -15,23 +18,66 @@ DEFAULT_WEIGHTS = {
 
 def calculate_skill_gap_cost(participant_skills: Dict[str, float], problem_skills: Dict[str, float]) -> float:
     """Lower is better."""
-    gaps = []
+    if not problem_skills:
+        return 0.0
+    # A plain mean: np.mean's overhead dominates for the handful of skills a
+    # problem requires. compute_cost_matrix covers the batched case.
+    total_gap = 0.0
     for skill, required_level in problem_skills.items():
         participant_level = participant_skills.get(skill, 0.0)
-        gaps.append(max(0, required_level - participant_level))
-    return np.mean(gaps) if gaps else 0.0
+        total_gap += max(0.0, required_level - participant_level)
+    return total_gap / len(problem_skills)
+
+def _role_weights_key(roles: Dict[str, float]) -> Tuple[Tuple[str, float], ...]:
+    return tuple(sorted(roles.items()))
+
+@lru_cache(maxsize=8192)
+def _role_alignment_cost_cached(participant_key: Tuple[Tuple[str, float], ...], problem_key: Tuple[Tuple[str, float], ...]) -> float:
+    problem_roles = dict(problem_key)
+    alignment = sum(problem_roles.get(role, 0.0) * weight for role, weight in participant_key)
+    return 1.0 - alignment
 
 def calculate_role_alignment_cost(participant_roles: Dict[str, float], problem_roles: Dict[str, float]) -> float:
     """Lower is better. Cost is 1 - alignment."""
-    # Assuming participant_roles is a weight map {role: weight}, not a list
-    alignment = sum(problem_roles.get(role, 0.0) * weight for role, weight in participant_roles.items())
-    return 1.0 - alignment
+    # Assuming participant_roles is a weight map {role: weight}, not a list.
+    # Role sets repeat heavily across participants, so the result is memoized
+    # on the (sorted) weight maps; it depends on nothing else.
+    return _role_alignment_cost_cached(_role_weights_key(participant_roles), _role_weights_key(problem_roles))
+
+# Up to this many dimensions, list embeddings are scored in pure Python.
+_SMALL_EMBEDDING_DIM = 16
 
 def calculate_motivation_similarity_cost(participant_embedding: np.ndarray, problem_embedding: np.ndarray) -> float:
     """Lower is better. Cost is cosine distance."""
     if participant_embedding is None or problem_embedding is None:
         return 1.0
-    return cosine(participant_embedding, problem_embedding)
+    # Same result as scipy's `cosine` without its per-call input validation,
+    # which dominates for the small vectors scored pair by pair. Callers should
+    # pass ndarrays they keep around; longer lists work but are converted per call.
+    u, v = participant_embedding, problem_embedding
+    if len(u) == len(v) <= _SMALL_EMBEDDING_DIM and not isinstance(u, np.ndarray) and not isinstance(v, np.ndarray):
+        # Tiny lists: builtin arithmetic beats numpy's per-call dispatch
+        uu = sum([x * x for x in u])
+        vv = sum([y * y for y in v])
+        uv = sum([x * y for x, y in zip(u, v)])
+    else:
+        uu, vv, uv = float(np.dot(u, u)), float(np.dot(v, v)), float(np.dot(u, v))
+    norms = math.sqrt(uu * vv)
+    if norms == 0.0:
+        return 1.0
+    return min(max(1.0 - uv / norms, 0.0), 2.0)
+
+def normalize_embedding(embedding: Sequence[float]) -> List[float]:
+    """
+    L2-normalises an embedding, as done once at ingest so stored vectors are
+    unit length and cosine distance reduces to 1 - a.b. Zero vectors are
+    returned unchanged.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    return vector.tolist()
 
 def calculate_ambiguity_fit_cost(participant_tolerance: float, problem_ambiguity: float) -> float:
     """Lower is better."""
@@ -39,4 +85,210 @@ def calculate_ambiguity_fit_cost(participant_tolerance: float, problem_ambiguity
 
 def calculate_workload_fit_cost(participant_availability: int, problem_hours: int) -> float:
     """Lower is better."""
-    return max(0, problem_hours - participant_availability) / 40.0 
\ No newline at end of file
+    return max(0, problem_hours - participant_availability) / 40.0 
+
+class SkillVocab:
+    """
+    Maps skill names to stable dense column indices, so per-record skill
+    levels can be held as arrays aligned to one shared layout.
+    """
+
+    def __init__(self, names: Sequence[str] = ()):
+        self._index: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        """Returns the column for `name`, assigning the next free one if it is new."""
+        index = self._index.get(name)
+        if index is None:
+            index = self._index[name] = len(self._index)
+        return index
+
+    def size(self) -> int:
+        return len(self._index)
+
+    def vector(self, skills: Dict[str, float], size: Optional[int] = None) -> np.ndarray:
+        """
+        Skill levels as a float32 array over the first `size` columns
+        (default: the whole vocabulary). Unknown skills are left out, since
+        no problem requires them.
+        """
+        vector = np.zeros(self.size() if size is None else size, dtype=np.float32)
+        for name, level in skills.items():
+            index = self._index.get(name)
+            if index is not None and index < vector.shape[0]:
+                vector[index] = level
+        return vector
+
+
+# Shared across calls so skill columns stay stable; seeded with the known skills.
+SKILL_VOCAB = SkillVocab(ALLOWED_SKILLS)
+
+
+# MongoDB projections covering every field the two readers below look at, so
+# callers can fetch just these instead of whole documents.
+PARTICIPANT_COST_PROJECTION = {
+    field: 1
+    for field in (
+        "skills", "self_rated_skills", "role_preferences", "primary_roles",
+        "motivation_embedding", "ambiguity_tolerance", "hours_per_week", "availability_hours",
+    )
+}
+PROBLEM_COST_PROJECTION = {
+    field: 1
+    for field in (
+        "required_skills", "role_preferences", "preferred_roles", "motivation_embedding",
+        "problem_embedding", "expected_ambiguity", "expected_hours_per_week",
+    )
+}
+
+
+def _participant_cost_inputs(participant: Dict[str, Any]):
+    """Pull the cost-relevant fields out of a formatted participant or a raw document."""
+    skills = participant.get("skills")
+    if skills is None:
+        skills = participant.get("self_rated_skills", {})
+    roles = participant.get("role_preferences")
+    if roles is None:
+        roles = {role: 1.0 for role in participant.get("primary_roles", [])}
+    hours = participant.get("hours_per_week")
+    if hours is None:
+        hours = participant.get("availability_hours", 20)
+    return (
+        skills,
+        roles,
+        participant.get("motivation_embedding"),
+        participant.get("ambiguity_tolerance", 0.5),
+        hours,
+    )
+
+
+def _problem_cost_inputs(problem: Dict[str, Any]):
+    """Pull the cost-relevant fields out of a formatted problem or a raw document."""
+    roles = problem.get("role_preferences")
+    if roles is None:
+        roles = problem.get("preferred_roles", {})
+    embedding = problem.get("motivation_embedding")
+    if embedding is None:
+        embedding = problem.get("problem_embedding")
+    return (
+        problem.get("required_skills", {}),
+        roles,
+        embedding,
+        problem.get("expected_ambiguity", 0.5),
+        problem.get("expected_hours_per_week", 20),
+    )
+
+
+def _embedding_matrix(embeddings: List[Optional[Any]], dim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack embeddings into an L2-normalised float32 (n, dim) matrix plus a validity mask."""
+    matrix = np.zeros((len(embeddings), dim), dtype=np.float32)
+    valid = np.zeros(len(embeddings), dtype=bool)
+    for i, embedding in enumerate(embeddings):
+        if embedding is not None and len(embedding) == dim:
+            matrix[i] = embedding
+            valid[i] = True
+    norms = np.linalg.norm(matrix, axis=1)
+    valid &= norms > 0
+    matrix[valid] /= norms[valid, None]
+    return matrix, valid
+
+
+def compute_cost_matrix(
+    participants: Sequence[Dict[str, Any]],
+    problems: Sequence[Dict[str, Any]],
+    weights: Optional[Dict[str, float]] = None,
+) -> np.ndarray:
+    """
+    Weighted participant x problem cost matrix, shape (P, Q). Lower is better.
+
+    Each record is unpacked once into column arrays, and every term is
+    computed for all pairs with broadcasting. Per pair, the terms match the
+    scalar `calculate_*` helpers above. A pair whose embeddings differ in
+    length is treated like a missing embedding and costs 1.0.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+
+    p_inputs = [_participant_cost_inputs(p) for p in participants]
+    q_inputs = [_problem_cost_inputs(q) for q in problems]
+    num_p, num_q = len(p_inputs), len(q_inputs)
+    if num_p == 0 or num_q == 0:
+        return np.zeros((num_p, num_q))
+
+    # Skill gap: mean shortfall over each problem's required skills.
+    q_columns = [[SKILL_VOCAB.intern(skill) for skill in q_skills] for q_skills, *_ in q_inputs]
+    num_skills = SKILL_VOCAB.size()
+    skill_gap = np.zeros((num_p, num_q))
+    if any(q_columns):
+        p_skill = np.stack([SKILL_VOCAB.vector(p_skills, num_skills) for p_skills, *_ in p_inputs])
+        q_skill = np.zeros((num_q, num_skills), dtype=np.float32)
+        q_required = np.zeros((num_q, num_skills), dtype=bool)
+        for j, ((q_skills, *_), columns) in enumerate(zip(q_inputs, q_columns)):
+            q_skill[j, columns] = list(q_skills.values())
+            q_required[j, columns] = True
+        # One (P, Q) slice per required skill keeps memory at O(P*Q) rather than O(P*Q*S).
+        for col in np.flatnonzero(q_required.any(axis=0)):
+            shortfall = np.maximum(q_skill[None, :, col] - p_skill[:, col, None], 0.0)
+            skill_gap += shortfall * q_required[None, :, col]
+        required_counts = q_required.sum(axis=1)
+        np.divide(skill_gap, required_counts[None, :], out=skill_gap, where=required_counts[None, :] > 0)
+
+    # Role alignment: 1 - <participant role weights, problem role weights>.
+    role_index = {}
+    for _, p_roles, *_ in p_inputs:
+        for role in p_roles:
+            role_index.setdefault(role, len(role_index))
+    p_role = np.zeros((num_p, len(role_index)))
+    for i, (_, p_roles, *_) in enumerate(p_inputs):
+        for role, weight in p_roles.items():
+            p_role[i, role_index[role]] = weight
+    q_role = np.zeros((num_q, len(role_index)))
+    for j, (_, q_roles, *_) in enumerate(q_inputs):
+        for role, weight in q_roles.items():
+            col = role_index.get(role)
+            if col is not None:
+                q_role[j, col] = weight
+    role_alignment = 1.0 - p_role @ q_role.T
+
+    # Motivation similarity: cosine distance between embeddings, one block
+    # per embedding length so only equal-length pairs are compared.
+    motivation = np.ones((num_p, num_q))
+    rows_by_dim: Dict[int, List[int]] = {}
+    for i, (_, _, embedding, *_) in enumerate(p_inputs):
+        if embedding is not None:
+            rows_by_dim.setdefault(len(embedding), []).append(i)
+    q_embeddings = [e for _, _, e, *_ in q_inputs]
+    for dim, rows in rows_by_dim.items():
+        p_emb, p_valid = _embedding_matrix([p_inputs[i][2] for i in rows], dim)
+        q_emb, q_valid = _embedding_matrix(q_embeddings, dim)
+        pair_valid = p_valid[:, None] & q_valid[None, :]
+        block = motivation[rows]
+        block[pair_valid] = (1.0 - (p_emb @ q_emb.T).astype(np.float64))[pair_valid]
+        motivation[rows] = block
+
+    p_tolerance = np.array([inputs[3] for inputs in p_inputs], dtype=np.float64)
+    q_ambiguity = np.array([inputs[3] for inputs in q_inputs], dtype=np.float64)
+    ambiguity_fit = np.abs(p_tolerance[:, None] - q_ambiguity[None, :])
+
+    p_hours = np.array([inputs[4] for inputs in p_inputs], dtype=np.float64)
+    q_hours = np.array([inputs[4] for inputs in q_inputs], dtype=np.float64)
+    workload_fit = np.maximum(q_hours[None, :] - p_hours[:, None], 0.0) / 40.0
+
+    return (
+        weights["skill_gap"] * skill_gap
+        + weights["role_alignment"] * role_alignment
+        + weights["motivation_similarity"] * motivation
+        + weights["ambiguity_fit"] * ambiguity_fit
+        + weights["workload_fit"] * workload_fit
+    )
+
+
+def compute_individual_cost(
+    participant: Dict[str, Any],
+    problem: Dict[str, Any],
+    weights: Optional[Dict[str, float]] = None,
+) -> float:
+    """Weighted cost of assigning one participant to one problem. Lower is better."""
+    return float(compute_cost_matrix([participant], [problem], weights)[0, 0])
@@ -1,9 +1,9 @@
 from typing import Dict, Tuple, Optional
 import numpy as np
-from scipy.optimize import linear_sum_assignment
 from datetime import datetime, timezone
 
 from app.db import db
+from app.matching.hungarian_capacity import solve_linear_assignment
 from app.models import Assignment
 
 async def solve_final_assignment(
@@ -14,21 +14,31 @@ async def solve_final_assignment(
     """
     Solves the assignment problem using the Hungarian algorithm.
     """
-    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    return solve_final_assignment_sync(cost_matrix, team_map, problem_map)
+
+def solve_final_assignment_sync(
+    cost_matrix: np.ndarray,
+    team_map: Dict[int, str],
+    problem_map: Dict[int, str]
+) -> Tuple[Dict[str, str], float]:
+    """
+    Synchronous body of `solve_final_assignment`; it is pure computation, so
+    callers without an event loop can use it directly.
+    """
+    # Both solvers work on contiguous float64; this only copies when the input isn't.
+    cost_matrix = np.ascontiguousarray(cost_matrix, dtype=np.float64)
+    row_ind, col_ind = solve_linear_assignment(cost_matrix)
     
     total_cost = cost_matrix[row_ind, col_ind].sum()
     
-    assignment_mapping = {}
-    num_teams = len(team_map)
-    num_problems = len(problem_map)
+    # Matrices are built rectangular, but a caller may still pad one square;
+    # pairs involving a padded row or column are skipped
+    assignment_mapping = {
+        problem_map[c]: team_map[r]
+        for r, c in zip(row_ind.tolist(), col_ind.tolist())
+        if r in team_map and c in problem_map
+    }
 
-    for r, c in zip(row_ind, col_ind):
-        # Only map real teams to real problems
-        if r < num_teams and c < num_problems:
-            team_id = team_map[r]
-            problem_id = problem_map[c]
-            assignment_mapping[problem_id] = team_id
-            
     return assignment_mapping, float(total_cost)
 
 async def store_final_assignments(
@@ -55,18 +65,16 @@ async def calculate_assignment_statistics(
     """
     Calculates statistics about the assignment quality.
     """
-    costs = []
-    
-    # Reverse maps for quick lookup
-    inv_team_map = {v: k for k, v in team_map.items()}
-    inv_problem_map = {v: k for k, v in problem_map.items()}
+    return calculate_assignment_statistics_sync(assignment_mapping, cost_matrix, team_map, problem_map)
 
-    for problem_id, team_id in assignment_mapping.items():
-        team_idx = inv_team_map[team_id]
-        problem_idx = inv_problem_map[problem_id]
-        costs.append(cost_matrix[team_idx, problem_idx])
-    
-    if not costs:
+def calculate_assignment_statistics_sync(
+    assignment_mapping: Dict[str, str],
+    cost_matrix: np.ndarray,
+    team_map: Dict[int, str],
+    problem_map: Dict[int, str]
+) -> Dict[str, float]:
+    """Synchronous body of `calculate_assignment_statistics`."""
+    if not assignment_mapping:
         return {
             "mean_cost": 0,
             "worst_case_cost": 0,
@@ -74,14 +82,24 @@ async def calculate_assignment_statistics(
             "assignment_efficiency": 0
         }
         
-    mean_cost = np.mean(costs)
-    worst_cost = np.max(costs)
-    best_cost = np.min(costs)
+    # Reverse maps for quick lookup
+    inv_team_map = {v: k for k, v in team_map.items()}
+    inv_problem_map = {v: k for k, v in problem_map.items()}
+
+    # Gather every assigned cell in one fancy-indexing pass
+    count = len(assignment_mapping)
+    team_idx = np.fromiter((inv_team_map[t] for t in assignment_mapping.values()), dtype=np.intp, count=count)
+    problem_idx = np.fromiter((inv_problem_map[p] for p in assignment_mapping), dtype=np.intp, count=count)
+    costs = cost_matrix[team_idx, problem_idx]
+
+    mean_cost = costs.mean()
+    worst_cost = costs.max()
+    best_cost = costs.min()
 
     # Efficiency: 1 - (mean_cost / theoretical_worst_cost)
     # Theoretical worst is sum of max costs in each row (assigning each team to its worst problem)
     theoretical_worst = np.sum(np.max(cost_matrix, axis=1))
-    efficiency = 1 - (np.sum(costs) / theoretical_worst) if theoretical_worst > 0 else 0
+    efficiency = 1 - (costs.sum() / theoretical_worst) if theoretical_worst > 0 else 0
 
     return {
         "mean_cost": float(mean_cost),
@@ -99,13 +117,16 @@ async def get_latest_assignment() -> Optional[Dict]:
 
 async def validate_assignment(assignment_mapping: Dict[str, str]) -> Dict:
     """Validates one-to-one mapping."""
-    teams = list(assignment_mapping.values())
-    problems = list(assignment_mapping.keys())
-    
-    is_one_to_one = len(teams) == len(set(teams))
+    return validate_assignment_sync(assignment_mapping)
+
+def validate_assignment_sync(assignment_mapping: Dict[str, str]) -> Dict:
+    """Synchronous body of `validate_assignment`."""
+    # Each problem is a key, so the mapping is one-to-one iff no team repeats
+    unique_teams = len(set(assignment_mapping.values()))
+    total_assignments = len(assignment_mapping)
     
     return {
-        "is_valid": is_one_to_one,
-        "unique_teams_assigned": len(set(teams)),
-        "total_assignments": len(teams),
+        "is_valid": unique_teams == total_assignments,
+        "unique_teams_assigned": unique_teams,
+        "total_assignments": total_assignments,
     } 
\ No newline at end of file
@@ -3,6 +3,24 @@ from typing import Dict, List, Tuple
 import numpy as np
 from scipy.optimize import linear_sum_assignment
 
+try:
+    import lap
+except ImportError:  # lap is optional; SciPy's solver is used without it
+    lap = None
+
+
+def solve_linear_assignment(cost_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Optimal (row_ind, col_ind) for a float64 cost matrix, in the form
+    `linear_sum_assignment` returns. Uses the Jonker-Volgenant solver from
+    `lap` when it is installed, which has less per-call overhead.
+    """
+    if lap is not None and cost_matrix.size:
+        _, x, _ = lap.lapjv(cost_matrix, extend_cost=True)
+        row_ind = np.flatnonzero(x >= 0)
+        return row_ind, x[row_ind]
+    return linear_sum_assignment(cost_matrix)
+
 
 def solve_hungarian_capacity(
     cost_matrix: np.ndarray,
@@ -11,20 +29,26 @@ def solve_hungarian_capacity(
 ) -> Tuple[Dict[str, List[str]], float]:
     """
     Solves the assignment problem using the Hungarian algorithm for capacity.
+
+    Problem capacity is expressed by `slot_map`, which gives each problem one
+    column per team slot, so a single C solver call (which releases the GIL) can
+    handle the whole capacitated problem.
     """
-    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    # Both solvers work on contiguous float64; this only copies when the input isn't.
+    cost_matrix = np.ascontiguousarray(cost_matrix, dtype=np.float64)
+    row_ind, col_ind = solve_linear_assignment(cost_matrix)
 
     assignments: Dict[str, List[str]] = {}
     total_cost = 0.0
 
-    for i, j in zip(row_ind, col_ind):
-        # Ignore assignments to padded rows/columns
-        if i < len(participant_map) and j < len(slot_map):
-            participant_id = participant_map[int(i)]
-            problem_id, _ = slot_map[int(j)]
-            if problem_id not in assignments:
-                assignments[problem_id] = []
-            assignments[problem_id].append(participant_id)
-            total_cost += cost_matrix[i, j]
+    for i, j in zip(row_ind.tolist(), col_ind.tolist()):
+        # Matrices are built rectangular; skip padded rows/columns if a caller adds them
+        if i not in participant_map or j not in slot_map:
+            continue
+        problem_id, _ = slot_map[j]
+        if problem_id not in assignments:
+            assignments[problem_id] = []
+        assignments[problem_id].append(participant_map[i])
+        total_cost += float(cost_matrix[i, j])
 
     return assignments, total_cost 
\ No newline at end of file
@@ -1,14 +1,42 @@
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Optional
 import numpy as np
+from app.matching.pair_cache import cached_participant_pair_cost_matrix
 from app.matching.pairwise import participant_pair_cost
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy swap scoring is used without it
+    njit = None
+
+
+def pairwise_cost_matrix(
+    participants: List[Dict[str, Any]],
+    cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float] = participant_pair_cost
+) -> np.ndarray:
+    """
+    Full (n, n) matrix of cost_function(participants[i], participants[j]).
+    
+    Computed once per clustering run so the PAM steps below work on table
+    lookups instead of calling the cost function inside every swap test.
+    """
+    if cost_function is participant_pair_cost:
+        return cached_participant_pair_cost_matrix(participants)
+    
+    n = len(participants)
+    distances = np.empty((n, n))
+    for i, a in enumerate(participants):
+        for j, b in enumerate(participants):
+            distances[i, j] = cost_function(a, b)
+    return distances
+
 
 def k_medoids_clustering(
     participants: List[Dict[str, Any]], 
     k: int,
     max_iter: int = 100,
     cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float] = participant_pair_cost,
-    random_seed: int = 42
+    random_seed: int = 42,
+    distances: Optional[np.ndarray] = None
 ) -> List[int]:
     """
     Perform k-medoids clustering using PAM (Partitioning Around Medoids) algorithm.
@@ -19,6 +47,7 @@ def k_medoids_clustering(
         max_iter: Maximum number of iterations for optimization
         cost_function: Function to calculate cost between two participants
         random_seed: Random seed for reproducible results
+        distances: Optional precomputed pairwise_cost_matrix(participants)
         
     Returns:
         List of medoid indices (indices into participants list)
@@ -28,8 +57,15 @@ def k_medoids_clustering(
     
     np.random.seed(random_seed)
     
+    if distances is None:
+        distances = pairwise_cost_matrix(participants, cost_function)
+    
+    # Indistinguishable participants: every choice of medoids costs the same
+    if not distances.any():
+        return list(range(k))
+    
     # Step 1: PAM initialization - select k initial medoids
-    medoids = _pam_initialization(participants, k, cost_function)
+    medoids = _pam_initialization(distances, k)
     
     # Step 2: Iterative improvement
     for iteration in range(max_iter):
@@ -37,24 +73,13 @@ def k_medoids_clustering(
         improved = False
         
         for i, medoid_idx in enumerate(medoids):
-            best_swap = None
-            best_cost_reduction = 0.0
-            
-            for candidate_idx in range(len(participants)):
-                if candidate_idx in medoids:
-                    continue
-                
-                # Calculate cost reduction if we swap medoid with candidate
-                cost_reduction = _calculate_swap_cost_reduction(
-                    participants, medoids, medoid_idx, candidate_idx, cost_function
-                )
-                
-                if cost_reduction > best_cost_reduction:
-                    best_cost_reduction = cost_reduction
-                    best_swap = candidate_idx
+            # Cost reduction for swapping this medoid with every candidate at once
+            reductions = _swap_cost_reductions(distances, np.asarray(medoids, dtype=np.int64), medoid_idx)
+            reductions[medoids] = -np.inf
             
+            best_swap = int(np.argmax(reductions))
             # Perform the best swap if it improves the solution
-            if best_swap is not None:
+            if reductions[best_swap] > 0.0:
                 medoids[i] = best_swap
                 improved = True
         
@@ -65,155 +90,106 @@ def k_medoids_clustering(
     return medoids
 
 
-def _pam_initialization(
-    participants: List[Dict[str, Any]], 
-    k: int, 
-    cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float]
-) -> List[int]:
+def _pam_initialization(distances: np.ndarray, k: int) -> List[int]:
     """
     PAM initialization: greedily select k medoids that minimize total cost.
     """
-    if k == 1:
-        # For k=1, select the participant with minimum average cost to all others
-        best_medoid = 0
-        best_avg_cost = float('inf')
-        
-        for i in range(len(participants)):
-            total_cost = sum(
-                cost_function(participants[i], participants[j])
-                for j in range(len(participants))
-                if i != j
-            )
-            avg_cost = total_cost / max(1, len(participants) - 1)
-            
-            if avg_cost < best_avg_cost:
-                best_avg_cost = avg_cost
-                best_medoid = i
-        
-        return [best_medoid]
-    
-    # For k > 1, use greedy selection
-    medoids = []
-    
-    # Select first medoid (same as k=1 case)
-    first_medoid = 0
-    best_avg_cost = float('inf')
-    
-    for i in range(len(participants)):
-        total_cost = sum(
-            cost_function(participants[i], participants[j])
-            for j in range(len(participants))
-            if i != j
-        )
-        avg_cost = total_cost / max(1, len(participants) - 1)
-        
-        if avg_cost < best_avg_cost:
-            best_avg_cost = avg_cost
-            first_medoid = i
+    n = distances.shape[0]
     
-    medoids.append(first_medoid)
+    # First medoid: the participant with minimum average cost to all others
+    avg_costs = (distances.sum(axis=1) - np.diag(distances)) / max(1, n - 1)
+    medoids = [int(np.argmin(avg_costs))]
     
     # Select remaining medoids greedily
     for _ in range(k - 1):
-        best_candidate = None
-        best_cost_reduction = 0.0
+        reductions = _addition_cost_reductions(distances, medoids)
+        reductions[medoids] = -np.inf
         
-        for candidate_idx in range(len(participants)):
-            if candidate_idx in medoids:
-                continue
-            
-            # Calculate how much total cost would be reduced by adding this candidate
-            cost_reduction = _calculate_addition_cost_reduction(
-                participants, medoids, candidate_idx, cost_function
-            )
-            
-            if cost_reduction > best_cost_reduction:
-                best_cost_reduction = cost_reduction
-                best_candidate = candidate_idx
-        
-        if best_candidate is not None:
+        best_candidate = int(np.argmax(reductions))
+        if reductions[best_candidate] > 0.0:
             medoids.append(best_candidate)
         else:
             # Fallback: add a random non-medoid
-            available = [i for i in range(len(participants)) if i not in medoids]
+            available = [i for i in range(n) if i not in medoids]
             if available:
                 medoids.append(np.random.choice(available))
     
     return medoids
 
 
-def _calculate_addition_cost_reduction(
-    participants: List[Dict[str, Any]], 
-    current_medoids: List[int], 
-    candidate_idx: int,
-    cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float]
-) -> float:
+def _addition_cost_reductions(distances: np.ndarray, current_medoids: List[int]) -> np.ndarray:
     """
-    Calculate how much total cost would be reduced by adding a new medoid.
+    How much total cost would be reduced by adding each participant as a new
+    medoid (one entry per candidate).
     """
-    total_reduction = 0.0
-    
-    for i in range(len(participants)):
-        if i == candidate_idx or i in current_medoids:
-            continue
-        
-        # Current minimum cost to existing medoids
-        current_min_cost = min(
-            cost_function(participants[i], participants[medoid_idx])
-            for medoid_idx in current_medoids
-        ) if current_medoids else float('inf')
-        
-        # Cost to new candidate
-        candidate_cost = cost_function(participants[i], participants[candidate_idx])
-        
-        # Reduction if candidate becomes the closest medoid
-        if candidate_cost < current_min_cost:
-            total_reduction += current_min_cost - candidate_cost
-    
-    return total_reduction
+    # Current minimum cost to existing medoids, per participant
+    current_min_cost = distances[:, current_medoids].min(axis=1)
+    
+    # Reduction where the candidate becomes the closest medoid
+    gains = np.maximum(current_min_cost[:, None] - distances, 0.0)
+    gains[current_medoids, :] = 0.0
+    np.fill_diagonal(gains, 0.0)
+    return gains.sum(axis=0)
 
 
-def _calculate_swap_cost_reduction(
-    participants: List[Dict[str, Any]], 
-    medoids: List[int], 
-    old_medoid_idx: int, 
-    new_medoid_idx: int,
-    cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float]
-) -> float:
+def _swap_cost_reductions_numpy(distances: np.ndarray, medoids: np.ndarray, old_medoid_idx: int) -> np.ndarray:
     """
-    Calculate how much total cost would be reduced by swapping medoids.
+    How much total cost would be reduced by swapping old_medoid_idx for each
+    participant (one entry per candidate). Medoids themselves and the
+    candidate are not counted.
     """
-    total_cost_change = 0.0
-    
-    for i in range(len(participants)):
-        if i in medoids or i == new_medoid_idx:
+    # Current assignment cost (minimum cost to any current medoid)
+    current_min_cost = distances[:, medoids].min(axis=1)
+    
+    # After the swap a participant's cost is the nearer of the kept medoids
+    # and the candidate
+    kept = [m for m in medoids if m != old_medoid_idx]
+    kept_min_cost = distances[:, kept].min(axis=1) if kept else np.full(distances.shape[0], np.inf)
+    new_min_cost = np.minimum(kept_min_cost[:, None], distances)
+    
+    changes = current_min_cost[:, None] - new_min_cost
+    changes[medoids, :] = 0.0
+    np.fill_diagonal(changes, 0.0)
+    return changes.sum(axis=0)
+
+
+def _swap_cost_reductions_kernel(distances: np.ndarray, medoids: np.ndarray, old_medoid_idx: int) -> np.ndarray:
+    """
+    Loop form of _swap_cost_reductions_numpy for numba: the same sums without
+    the (n, n) temporaries.
+    """
+    n = distances.shape[0]
+    is_medoid = np.zeros(n, dtype=np.bool_)
+    for m in medoids:
+        is_medoid[m] = True
+    
+    reductions = np.zeros(n)
+    for p in range(n):
+        if is_medoid[p]:
             continue
-        
-        # Current assignment cost (minimum cost to any current medoid)
-        current_costs = [
-            cost_function(participants[i], participants[medoid_idx])
-            for medoid_idx in medoids
-        ]
-        current_min_cost = min(current_costs)
-        
-        # New assignment cost after swap
-        new_medoids = [new_medoid_idx if m == old_medoid_idx else m for m in medoids]
-        new_costs = [
-            cost_function(participants[i], participants[medoid_idx])
-            for medoid_idx in new_medoids
-        ]
-        new_min_cost = min(new_costs)
-        
-        # Cost change for this participant
-        total_cost_change += current_min_cost - new_min_cost
-    
-    return total_cost_change
+        current_min_cost = np.inf
+        kept_min_cost = np.inf
+        for m in medoids:
+            current_min_cost = min(current_min_cost, distances[p, m])
+            if m != old_medoid_idx:
+                kept_min_cost = min(kept_min_cost, distances[p, m])
+        for c in range(n):
+            if c != p:
+                reductions[c] += current_min_cost - min(kept_min_cost, distances[p, c])
+    return reductions
+
+
+if njit is not None:
+    _swap_cost_reductions = njit(cache=True)(_swap_cost_reductions_kernel)
+else:
+    _swap_cost_reductions = _swap_cost_reductions_numpy
 
 
 def assign_to_medoids(
     participants: List[Dict[str, Any]], 
     medoids: List[int],
-    cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float] = participant_pair_cost
+    cost_function: Callable[[Dict[str, Any], Dict[str, Any]], float] = participant_pair_cost,
+    distances: Optional[np.ndarray] = None
 ) -> List[List[int]]:
     """
     Assign each participant to the nearest medoid.
@@ -222,6 +198,8 @@ def assign_to_medoids(
         participants: List of participant dictionaries
         medoids: List of medoid indices
         cost_function: Function to calculate cost between participants
+        distances: Optional precomputed (n, n) cost matrix; when given,
+            cost_function is not called
         
     Returns:
         List of clusters, where each cluster is a list of participant indices
@@ -229,24 +207,18 @@ def assign_to_medoids(
     if not medoids:
         return []
     
-    clusters: List[List[int]] = [[] for _ in medoids]
-    
-    for i, participant in enumerate(participants):
-        if i in medoids:
-            # Medoids assign to themselves
-            medoid_position = medoids.index(i)
-            clusters[medoid_position].append(i)
-        else:
-            # Find nearest medoid
-            min_cost = float('inf')
-            best_medoid_idx = 0
-            
-            for j, medoid_idx in enumerate(medoids):
-                cost = cost_function(participant, participants[medoid_idx])
-                if cost < min_cost:
-                    min_cost = cost
-                    best_medoid_idx = j
-            
-            clusters[best_medoid_idx].append(i)
-    
-    return clusters
+    if distances is None:
+        costs = np.array(
+            [[cost_function(participant, participants[m]) for m in medoids] for participant in participants],
+            dtype=float,
+        ).reshape(len(participants), len(medoids))
+    else:
+        costs = distances[:, medoids]
+    
+    # argmin keeps the first of tied medoids, as the scan it replaces did
+    nearest = costs.argmin(axis=1)
+    # Medoids assign to themselves
+    for position, medoid_idx in reversed(list(enumerate(medoids))):
+        nearest[medoid_idx] = position
+    
+    return [np.flatnonzero(nearest == j).tolist() for j in range(len(medoids))]
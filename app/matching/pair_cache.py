@@ -0,0 +1,81 @@
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.config import PAIR_COST_CACHE_DIR
+from app.matching.pairwise import participant_pair_cost_matrix
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever participant_pair_cost changes, so matrices cached under the
+# old formula are never read back.
+PAIR_COST_FEATURE_VERSION = 1
+
+
+def pair_cost_key(participants: List[Dict[str, Any]]) -> str:
+    """
+    Content hash of the fields participant_pair_cost reads, in row order.
+    Any edit to a participant's roles, skills, availability, motivation text
+    or embedding gives a different key.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f"v{PAIR_COST_FEATURE_VERSION}:{len(participants)}".encode())
+    for p in participants:
+        skills = sorted((name, value.get("mean", 0.0)) for name, value in p.get("enriched_skills", {}).items())
+        hasher.update(repr((
+            str(p.get("_id")),
+            sorted(p.get("primary_roles", [])),
+            skills,
+            p.get("availability_hours", 20),
+            len(p.get("motivation_text", "")),
+        )).encode())
+        embedding = p.get("motivation_embedding")
+        hasher.update(b"-" if embedding is None else np.asarray(embedding, dtype=np.float64).tobytes() + b";")
+    return hasher.hexdigest()
+
+
+def load(key: str, cache_dir: Optional[str] = PAIR_COST_CACHE_DIR) -> Optional[np.ndarray]:
+    """The matrix stored under `key`, or None if caching is off or it is missing."""
+    if not cache_dir:
+        return None
+    try:
+        return np.load(Path(cache_dir) / f"{key}.npy")
+    except (OSError, ValueError):
+        return None
+
+
+def store(key: str, matrix: np.ndarray, cache_dir: Optional[str] = PAIR_COST_CACHE_DIR) -> None:
+    """Writes `matrix` under `key`; failures are logged, never raised."""
+    if not cache_dir:
+        return
+    path = Path(cache_dir) / f"{key}.npy"
+    tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp.npy")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(tmp_path, matrix)
+        # Atomic rename, so concurrent workers never read a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache pair cost matrix at {path}: {e}")
+
+
+def cached_participant_pair_cost_matrix(
+    participants: List[Dict[str, Any]],
+    cache_dir: Optional[str] = PAIR_COST_CACHE_DIR,
+) -> np.ndarray:
+    """
+    participant_pair_cost_matrix, persisted across matching runs under
+    `cache_dir` (PAIR_COST_CACHE_DIR by default; unset disables the cache).
+    """
+    if not cache_dir or not participants:
+        return participant_pair_cost_matrix(participants)
+    key = pair_cost_key(participants)
+    matrix = load(key, cache_dir)
+    if matrix is None or matrix.shape != (len(participants), len(participants)):
+        matrix = participant_pair_cost_matrix(participants)
+        store(key, matrix, cache_dir)
+    return matrix
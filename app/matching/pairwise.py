@@ -1,7 +1,32 @@
-from typing import Any, Dict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
-from scipy.spatial.distance import cosine
+
+from app.matching.cost import calculate_motivation_similarity_cost
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy skill-overlap matrix is used without it
+    njit = None
+
+# Pair costs keyed by (_id, _id), only while a pair_cost_cache() block is active.
+# Ids alone cannot tell whether a document changed, so caching is opt-in and
+# scoped to one matching run over a fixed set of participant records.
+_PAIR_COST_CACHE: ContextVar[Optional[Dict[Tuple[Any, Any], float]]] = ContextVar(
+    "pair_cost_cache", default=None
+)
+
+
+@contextmanager
+def pair_cost_cache() -> Iterator[None]:
+    """Memoize participant_pair_cost by participant _id for the duration of the block."""
+    token = _PAIR_COST_CACHE.set({})
+    try:
+        yield
+    finally:
+        _PAIR_COST_CACHE.reset(token)
 
 
 def participant_pair_cost(a: Dict[str, Any], b: Dict[str, Any]) -> float:
@@ -17,9 +42,24 @@ def participant_pair_cost(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     Returns:
         Cost value (0-1 range, lower is better for pairing)
     """
-    if a.get("_id") == b.get("_id"):
+    id_a, id_b = a.get("_id"), b.get("_id")
+    if id_a == id_b:
         return 0.0  # Zero cost for same participant
     
+    cache = _PAIR_COST_CACHE.get()
+    if cache is None or id_a is None or id_b is None:
+        return _participant_pair_cost(a, b)
+    
+    # The cost is symmetric, so either key order is a hit
+    cost = cache.get((id_a, id_b))
+    if cost is None:
+        cost = cache.get((id_b, id_a))
+        if cost is None:
+            cost = cache[(id_a, id_b)] = _participant_pair_cost(a, b)
+    return cost
+
+
+def _participant_pair_cost(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     role_diversity_penalty = _role_diversity_penalty(a, b)
     skill_overlap = _skill_overlap_penalty(a, b)
     comm_clash = _communication_style_clash(a, b)
@@ -32,25 +72,35 @@ def participant_pair_cost(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     return max(0.0, min(1.0, cost))
 
 
+# Bit assigned to each role name the first time it is seen, so a role list
+# can be held as one int and compared with & / | and popcounts.
+_ROLE_BITS: Dict[str, int] = {}
+
+
+def _role_mask(roles: List[str]) -> int:
+    """Bitmask of `roles`; duplicates collapse, as in a set."""
+    mask = 0
+    for role in roles:
+        bit = _ROLE_BITS.get(role)
+        if bit is None:
+            bit = _ROLE_BITS[role] = 1 << len(_ROLE_BITS)
+        mask |= bit
+    return mask
+
+
 def _role_diversity_penalty(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     """
     Calculate penalty for lack of role compatibility.
     Returns 0-1 where 1 is maximum penalty (no role overlap).
     """
-    roles_a = set(a.get("primary_roles", []))
-    roles_b = set(b.get("primary_roles", []))
+    roles_a = _role_mask(a.get("primary_roles", []))
+    roles_b = _role_mask(b.get("primary_roles", []))
     
     if not roles_a or not roles_b:
         return 0.5  # Medium penalty for missing role data
     
-    intersection = roles_a & roles_b
-    union = roles_a | roles_b
-    
-    if not union:
-        return 0.5
-    
     # High penalty for low role overlap (incompatible roles)
-    overlap_ratio = len(intersection) / len(union)
+    overlap_ratio = (roles_a & roles_b).bit_count() / (roles_a | roles_b).bit_count()
     return 1.0 - overlap_ratio  # Invert: penalty for lack of overlap
 
 
@@ -65,27 +115,30 @@ def _skill_overlap_penalty(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     if not skills_a or not skills_b:
         return 0.0
     
-    # Get common skills
-    common_skills = set(skills_a.keys()) & set(skills_b.keys())
+    # Get common skills (a keys view intersects without copying either dict)
+    common_skills = skills_a.keys() & skills_b.keys()
     
     if not common_skills:
         return 0.0
     
     # Calculate overlap based on skill levels
-    overlap_scores = []
+    overlap_total = 0.0
+    overlap_count = 0
     for skill in common_skills:
         level_a = skills_a[skill].get("mean", 0.0)
         level_b = skills_b[skill].get("mean", 0.0)
         
         # High overlap when both have high skill levels
         if level_a > 3.0 and level_b > 3.0:
-            overlap_scores.append(min(level_a, level_b) / 5.0)
+            overlap_total += min(level_a, level_b) / 5.0
+            overlap_count += 1
     
-    if not overlap_scores:
+    if not overlap_count:
         return 0.0
     
-    # Average overlap penalty, scaled by number of overlapping skills
-    avg_overlap = np.mean(overlap_scores)
+    # Average overlap penalty, scaled by number of overlapping skills.
+    # A plain mean: np.mean costs microseconds on these few-element lists.
+    avg_overlap = overlap_total / overlap_count
     skill_coverage = len(common_skills) / max(len(skills_a), len(skills_b))
     
     return avg_overlap * skill_coverage
@@ -134,10 +187,178 @@ def _motivation_similarity(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     
     if embedding_a is None or embedding_b is None:
         return 0.0  # No similarity if embeddings missing
-    
-    try:
-        # Cosine similarity = 1 - cosine distance
-        similarity = 1.0 - cosine(embedding_a, embedding_b)
-        return max(0.0, similarity)  # Clamp to [0, 1]
-    except (ValueError, TypeError):
+    if len(embedding_a) != len(embedding_b):
         return 0.0
+    
+    # Cosine similarity = 1 - cosine distance; zero vectors have distance 1.
+    # Uses the plain dot-product kernel rather than scipy's validating one.
+    similarity = 1.0 - calculate_motivation_similarity_cost(embedding_a, embedding_b)
+    return max(0.0, similarity)  # Clamp to [0, 1]
+
+
+def participant_pair_cost_matrix(participants: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Full (N, N) matrix of `participant_pair_cost` over every ordered pair.
+    
+    Each participant is unpacked once into dense arrays (role indicators,
+    skill levels, availability, embeddings) and every term is computed for
+    all pairs with broadcasting and matrix products, instead of N^2 calls
+    that each re-read the dicts and build sets.
+    """
+    n = len(participants)
+    if n == 0:
+        return np.zeros((0, 0))
+    
+    cost = (
+        0.4 * _role_diversity_penalty_matrix(participants)
+        + 0.3 * _skill_overlap_penalty_matrix(participants)
+        + 0.3 * _communication_style_clash_matrix(participants)
+        - 0.2 * _motivation_similarity_matrix(participants)
+    )
+    np.clip(cost, 0.0, 1.0, out=cost)
+    
+    # Zero cost for same participant (matched by _id, as in the scalar version)
+    id_groups: Dict[Any, int] = {}
+    group = np.array([id_groups.setdefault(p.get("_id"), len(id_groups)) for p in participants])
+    cost[group[:, None] == group[None, :]] = 0.0
+    return cost
+
+
+def _indicator_matrix(keys_per_row: List[Any]) -> Tuple[np.ndarray, Dict[Any, int]]:
+    """(N, K) 0/1 matrix marking which of the union of keys each row has."""
+    index: Dict[Any, int] = {}
+    for keys in keys_per_row:
+        for key in keys:
+            index.setdefault(key, len(index))
+    indicator = np.zeros((len(keys_per_row), len(index)))
+    for i, keys in enumerate(keys_per_row):
+        indicator[i, [index[key] for key in keys]] = 1.0
+    return indicator, index
+
+
+def _role_diversity_penalty_matrix(participants: List[Dict[str, Any]]) -> np.ndarray:
+    roles, _ = _indicator_matrix([set(p.get("primary_roles", [])) for p in participants])
+    counts = roles.sum(axis=1)
+    intersection = roles @ roles.T
+    union = counts[:, None] + counts[None, :] - intersection
+    
+    penalty = np.full(intersection.shape, 0.5)  # Medium penalty for missing role data
+    known = (counts[:, None] > 0) & (counts[None, :] > 0)
+    penalty[known] = 1.0 - intersection[known] / union[known]
+    return penalty
+
+
+def _skill_overlap_penalty_matrix(participants: List[Dict[str, Any]]) -> np.ndarray:
+    # Flatten every participant's skills into (row, column, mean) triples in
+    # one pass, then scatter them into dense (N, S) arrays with a single
+    # fancy-indexed assignment each.
+    index: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    means: List[float] = []
+    for i, p in enumerate(participants):
+        for skill, value in p.get("enriched_skills", {}).items():
+            rows.append(i)
+            cols.append(index.setdefault(skill, len(index)))
+            means.append(value.get("mean", 0.0))
+    present = np.zeros((len(participants), len(index)))
+    levels = np.zeros(present.shape)
+    present[rows, cols] = 1.0
+    levels[rows, cols] = means
+    return _skill_overlap_penalty_dense(present, levels)
+
+
+def _skill_overlap_penalty_numpy(present: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    common = present @ present.T
+    # Only common skills where both levels exceed 3.0 contribute min(level) / 5
+    high = (present > 0) & (levels > 3.0)
+    high_counts = high.astype(float) @ high.T.astype(float)
+    high_sums = np.zeros(common.shape)
+    for col in np.flatnonzero(high.any(axis=0)):
+        both = high[:, col, None] & high[None, :, col]
+        high_sums += np.minimum(levels[:, col, None], levels[None, :, col]) * both
+    
+    sizes = present.sum(axis=1)
+    larger = np.maximum(sizes[:, None], sizes[None, :])
+    penalty = np.zeros(common.shape)
+    scored = high_counts > 0
+    penalty[scored] = (high_sums[scored] / 5.0 / high_counts[scored]) * (common[scored] / larger[scored])
+    return penalty
+
+
+def _skill_overlap_penalty_kernel(present: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """
+    Loop form of _skill_overlap_penalty_numpy for numba: one pass per pair over
+    the skill columns, without the (N, N) temporaries per high-level skill.
+    """
+    n, num_skills = present.shape
+    penalty = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i, n):
+            common = 0.0
+            high_count = 0.0
+            high_sum = 0.0
+            size_i = 0.0
+            size_j = 0.0
+            for s in range(num_skills):
+                in_i = present[i, s] > 0
+                in_j = present[j, s] > 0
+                size_i += present[i, s]
+                size_j += present[j, s]
+                if in_i and in_j:
+                    common += 1.0
+                    if levels[i, s] > 3.0 and levels[j, s] > 3.0:
+                        high_count += 1.0
+                        high_sum += min(levels[i, s], levels[j, s])
+            if high_count > 0:
+                value = (high_sum / 5.0 / high_count) * (common / max(size_i, size_j))
+                penalty[i, j] = value
+                penalty[j, i] = value
+    return penalty
+
+
+if njit is not None:
+    _skill_overlap_penalty_dense = njit(cache=True)(_skill_overlap_penalty_kernel)
+else:
+    _skill_overlap_penalty_dense = _skill_overlap_penalty_numpy
+
+
+def _communication_style_clash_matrix(participants: List[Dict[str, Any]]) -> np.ndarray:
+    avail = np.array([p.get("availability_hours", 20) for p in participants], dtype=float)
+    text_len = np.array([len(p.get("motivation_text", "")) for p in participants], dtype=float)
+    
+    max_avail = np.maximum(avail[:, None], avail[None, :])
+    max_len = np.maximum(text_len[:, None], text_len[None, :])
+    availability_clash = np.divide(
+        np.abs(avail[:, None] - avail[None, :]), max_avail,
+        out=np.zeros(max_avail.shape), where=max_avail != 0,
+    )
+    text_clash = np.divide(
+        np.abs(text_len[:, None] - text_len[None, :]), max_len,
+        out=np.zeros(max_len.shape), where=max_len != 0,
+    )
+    clash = (availability_clash + text_clash) / 2.0
+    # The scalar version returns 0 outright when neither has any availability
+    clash[max_avail == 0] = 0.0
+    return clash
+
+
+def _motivation_similarity_matrix(participants: List[Dict[str, Any]]) -> np.ndarray:
+    n = len(participants)
+    similarity = np.zeros((n, n))
+    
+    # Only pairs of equal-length, non-zero embeddings have a similarity
+    rows_by_dim: Dict[int, List[int]] = {}
+    for i, p in enumerate(participants):
+        embedding = p.get("motivation_embedding")
+        if embedding is not None and len(embedding) > 0:
+            rows_by_dim.setdefault(len(embedding), []).append(i)
+    
+    for rows in rows_by_dim.values():
+        embeddings = np.array([participants[i]["motivation_embedding"] for i in rows], dtype=float)
+        norms = np.linalg.norm(embeddings, axis=1)
+        nonzero = norms > 0
+        rows = np.asarray(rows)[nonzero]
+        unit = embeddings[nonzero] / norms[nonzero, None]
+        similarity[np.ix_(rows, rows)] = np.clip(unit @ unit.T, 0.0, 1.0)
+    return similarity
@@ -1,8 +1,8 @@
 from typing import Any, Dict, List, Optional
 import numpy as np
-from scipy.optimize import linear_sum_assignment
+from app.matching.hungarian_capacity import solve_linear_assignment
 from app.matching.pairwise import participant_pair_cost
-from app.config import ALLOWED_ROLES
+from app.config import ALLOWED_ROLES, ALLOWED_ROLE_SET
 
 
 def solve_team_slots(
@@ -23,6 +23,10 @@ def solve_team_slots(
     Returns:
         List of completed teams with filled slots
     """
+    if not teams:
+        # Nothing to fill; skip scanning the participant pool
+        return []
+    
     completed_teams = []
     
     # Build set of all participants already assigned to teams
@@ -95,8 +99,8 @@ def _fill_team_slots(
     # Build cost matrix for assignment
     cost_matrix = _build_slot_cost_matrix(existing_team, candidate_pool, slots_to_fill)
     
-    # Solve assignment problem
-    row_indices, col_indices = linear_sum_assignment(cost_matrix)
+    # Solve assignment problem (one row per slot, so exactly slots_to_fill picks)
+    row_indices, col_indices = solve_linear_assignment(cost_matrix)
     
     # Extract assigned participants
     assigned_participants = [candidate_pool[col_idx] for col_idx in col_indices]
@@ -123,21 +127,20 @@ def _build_slot_cost_matrix(
     slots_to_fill: int
 ) -> np.ndarray:
     """
-    Build cost matrix for slot assignment problem.
-    """
-    num_candidates = len(candidates)
-    
-    # Create square matrix (pad with high cost if needed)
-    matrix_size = max(slots_to_fill, num_candidates)
-    cost_matrix = np.full((matrix_size, matrix_size), 1e6)  # High cost for padding
-    
-    # Fill actual costs
-    for slot_idx in range(slots_to_fill):
-        for candidate_idx, candidate in enumerate(candidates):
-            cost = _calculate_slot_assignment_cost(existing_team, candidate)
-            cost_matrix[slot_idx, candidate_idx] = cost
+    Build the (slots_to_fill, num_candidates) cost matrix for slot assignment.
     
-    return cost_matrix
+    A candidate's cost does not depend on which slot they take, so each
+    candidate is scored once and the row is repeated for every slot. The
+    matrix is left rectangular: the solver assigns one candidate per slot
+    without padding rows, which would otherwise pull every leftover
+    candidate into the team.
+    """
+    candidate_costs = np.fromiter(
+        (_calculate_slot_assignment_cost(existing_team, candidate) for candidate in candidates),
+        dtype=np.float64,
+        count=len(candidates),
+    )
+    return np.tile(candidate_costs, (slots_to_fill, 1))
 
 
 def _calculate_slot_assignment_cost(
@@ -255,7 +258,7 @@ def _improve_role_coverage(
     for member in existing_team:
         existing_roles.update(member.get("primary_roles", []))
     
-    missing_roles = set(ALLOWED_ROLES) - existing_roles
+    missing_roles = ALLOWED_ROLE_SET - existing_roles
     
     if not missing_roles:
         return None  # Already have good coverage
@@ -383,3 +386,74 @@ def calculate_team_coverage_metrics(team: List[Dict[str, Any]]) -> Dict[str, flo
         "confidence_score": confidence_score,
         "role_balance_flag": role_balance_flag
     }
+
+
+
+def calculate_all_team_coverage_metrics(
+    teams: List[List[Dict[str, Any]]]
+) -> List[Dict[str, float]]:
+    """
+    Calculate coverage metrics for every team in one batched pass.
+
+    Produces the same values as calling `calculate_team_coverage_metrics` on
+    each team, but builds the role/skill vocabularies once and computes every
+    metric column-wise over a (teams x roles) / (teams x skills) matrix.
+
+    Args:
+        teams: List of teams, each a list of participant dictionaries
+
+    Returns:
+        List of coverage metric dictionaries, one per team
+    """
+    num_teams = len(teams)
+    if num_teams == 0:
+        return []
+
+    role_index: Dict[str, int] = {}
+    skill_index: Dict[str, int] = {}
+    role_rows: List[int] = []
+    role_cols: List[int] = []
+    skill_rows: List[int] = []
+    skill_cols: List[int] = []
+    skill_means: List[float] = []
+
+    for t, team in enumerate(teams):
+        for member in team:
+            for role in member.get("primary_roles", []):
+                role_rows.append(t)
+                role_cols.append(role_index.setdefault(role, len(role_index)))
+            for skill, skill_data in member.get("enriched_skills", {}).items():
+                skill_rows.append(t)
+                skill_cols.append(skill_index.setdefault(skill, len(skill_index)))
+                skill_means.append(skill_data.get("mean", 0.0))
+
+    team_sizes = np.fromiter((len(team) for team in teams), dtype=np.int64, count=num_teams)
+
+    role_counts = np.zeros((num_teams, len(role_index)), dtype=np.int64)
+    np.add.at(role_counts, (role_rows, role_cols), 1)
+
+    skill_present = np.zeros((num_teams, len(skill_index)), dtype=bool)
+    skill_present[skill_rows, skill_cols] = True
+
+    role_coverage = np.count_nonzero(role_counts, axis=1) / len(ALLOWED_ROLES)
+    skill_coverage = skill_present.sum(axis=1) / np.maximum(1, team_sizes)
+    skill_coverage_normalized = np.minimum(1.0, skill_coverage / 3.0)
+    diversity_score = (role_coverage + skill_coverage_normalized) / 2.0
+
+    skill_totals = np.bincount(skill_rows, weights=skill_means, minlength=num_teams)
+    skill_counts = np.bincount(skill_rows, minlength=num_teams)
+    confidence_score = skill_totals / np.maximum(1, skill_counts) / 5.0
+
+    max_role_count = role_counts.max(axis=1) if role_index else np.zeros(num_teams)
+    role_balance_flag = (max_role_count <= team_sizes * 0.6) & (team_sizes > 0)
+
+    return [
+        {
+            "role_coverage": float(role_coverage[t]),
+            "skill_coverage": float(skill_coverage[t]),
+            "diversity_score": float(diversity_score[t]),
+            "confidence_score": float(confidence_score[t]),
+            "role_balance_flag": bool(role_balance_flag[t]),
+        }
+        for t in range(num_teams)
+    ]
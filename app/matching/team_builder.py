@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 import math
-from app.matching.kmedoids import k_medoids_clustering, assign_to_medoids
+from app.matching.kmedoids import k_medoids_clustering, assign_to_medoids, pairwise_cost_matrix
 from app.matching.pairwise import participant_pair_cost
 
 
@@ -56,16 +56,20 @@ def _cluster_into_teams(
     if len(participants) <= desired_team_size:
         return [participants]
     
+    # Pairwise costs are computed once and shared by both steps
+    distances = pairwise_cost_matrix(participants)
+    
     # Step 1: Find k medoids
     medoid_indices = k_medoids_clustering(
         participants, 
         k=k, 
         max_iter=max_iter, 
-        random_seed=random_seed
+        random_seed=random_seed,
+        distances=distances
     )
     
     # Step 2: Assign all participants to nearest medoid
-    clusters = assign_to_medoids(participants, medoid_indices)
+    clusters = assign_to_medoids(participants, medoid_indices, distances=distances)
     
     # Step 3: Convert index-based clusters to participant-based teams
     teams = []
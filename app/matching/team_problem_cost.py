@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 import numpy as np
 
 from app.models import Problem
@@ -9,6 +9,7 @@ from app.matching.cost import (
     calculate_motivation_similarity_cost,
     calculate_ambiguity_fit_cost,
     calculate_workload_fit_cost,
+    compute_cost_matrix,
 )
 
 async def compute_team_problem_cost(
@@ -19,44 +20,97 @@ async def compute_team_problem_cost(
     """
     Calculates the cost between a team and a problem using a weighted formula.
     """
+    return compute_team_problem_cost_sync(team_vector, problem, weights)
+
+def compute_team_problem_cost_sync(
+    team_vector: TeamVector,
+    problem: Problem,
+    weights: Dict[str, float],
+) -> float:
+    """
+    Synchronous body of `compute_team_problem_cost`; it never awaits, so
+    callers in loops can skip a coroutine per team/problem pair.
+
+    Terms are folded into the total as they are computed, and a term whose
+    weight is zero is skipped outright (no embedding dot products when
+    motivation similarity is switched off).
+    """
+    total_cost = 0.0
+
     # 1. Skill Gap
-    skill_gap = calculate_skill_gap_cost(
-        participant_skills=team_vector.avg_skill_levels,
-        problem_skills=problem.required_skills,
-    )
+    weight = weights["skill_gap"]
+    if weight:
+        total_cost += weight * calculate_skill_gap_cost(
+            participant_skills=team_vector.avg_skill_levels,
+            problem_skills=problem.required_skills,
+        )
 
     # 2. Role Alignment
-    role_alignment = calculate_role_alignment_cost(
-        participant_roles=team_vector.role_weights,
-        problem_roles=problem.role_preferences,
-    )
+    weight = weights["role_alignment"]
+    if weight:
+        total_cost += weight * calculate_role_alignment_cost(
+            participant_roles=team_vector.role_weights,
+            problem_roles=problem.role_preferences,
+        )
 
     # 3. Motivation Similarity
-    motivation_similarity = 1.0  # Default if no embeddings
-    if team_vector.avg_motivation_embedding and problem.problem_embedding:
-        motivation_similarity = calculate_motivation_similarity_cost(
-            participant_embedding=np.array(team_vector.avg_motivation_embedding),
-            problem_embedding=np.array(problem.problem_embedding),
-        )
+    weight = weights["motivation_similarity"]
+    if weight:
+        motivation_similarity = 1.0  # Default if no embeddings
+        if team_vector.avg_motivation_embedding and problem.problem_embedding:
+            motivation_similarity = calculate_motivation_similarity_cost(
+                participant_embedding=team_vector.motivation_embedding_array,
+                problem_embedding=np.asarray(problem.problem_embedding),
+            )
+        total_cost += weight * motivation_similarity
 
     # 4. Ambiguity Fit
-    ambiguity_fit = calculate_ambiguity_fit_cost(
-        participant_tolerance=team_vector.avg_ambiguity_tolerance,
-        problem_ambiguity=problem.expected_ambiguity,
-    )
+    weight = weights["ambiguity_fit"]
+    if weight:
+        total_cost += weight * calculate_ambiguity_fit_cost(
+            participant_tolerance=team_vector.avg_ambiguity_tolerance,
+            problem_ambiguity=problem.expected_ambiguity,
+        )
 
     # 5. Workload Fit
-    workload_fit = calculate_workload_fit_cost(
-        participant_availability=team_vector.min_availability,
-        problem_hours=problem.expected_hours_per_week,
-    )
-
-    total_cost = (
-        weights["skill_gap"] * skill_gap +
-        weights["role_alignment"] * role_alignment +
-        weights["motivation_similarity"] * motivation_similarity +
-        weights["ambiguity_fit"] * ambiguity_fit +
-        weights["workload_fit"] * workload_fit
-    )
-    
-    return total_cost 
\ No newline at end of file
+    weight = weights["workload_fit"]
+    if weight:
+        total_cost += weight * calculate_workload_fit_cost(
+            participant_availability=team_vector.min_availability,
+            problem_hours=problem.expected_hours_per_week,
+        )
+
+    return total_cost
+
+
+def compute_team_problem_cost_matrix(
+    team_vectors: List[TeamVector],
+    problems: List[Problem],
+    weights: Dict[str, float],
+) -> np.ndarray:
+    """
+    Team x problem cost matrix, shape (T, P), matching
+    `compute_team_problem_cost` cell by cell but computed in one vectorized
+    pass by `compute_cost_matrix`.
+    """
+    teams = [
+        {
+            "skills": tv.avg_skill_levels,
+            "role_preferences": tv.role_weights,
+            "motivation_embedding": tv.avg_motivation_embedding,
+            "ambiguity_tolerance": tv.avg_ambiguity_tolerance,
+            "hours_per_week": tv.min_availability,
+        }
+        for tv in team_vectors
+    ]
+    problem_rows = [
+        {
+            "required_skills": problem.required_skills,
+            "role_preferences": problem.role_preferences,
+            "problem_embedding": problem.problem_embedding,
+            "expected_ambiguity": problem.expected_ambiguity,
+            "expected_hours_per_week": problem.expected_hours_per_week,
+        }
+        for problem in problems
+    ]
+    return compute_cost_matrix(teams, problem_rows, weights)
@@ -1,6 +1,6 @@
 import numpy as np
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Dict, List, Optional, Tuple
 
 from app.models import Participant, Team
 
@@ -17,6 +17,25 @@ class TeamVector(BaseModel):
     avg_ambiguity_tolerance: float
     avg_confidence_score: float
 
+    # (source list, converted array); keyed on the list's identity so that
+    # reassigning the field or model_copy(update=...) never serves a stale array
+    _embedding_array: Optional[Tuple[List[float], np.ndarray]] = PrivateAttr(default=None)
+
+    @property
+    def motivation_embedding_array(self) -> Optional[np.ndarray]:
+        """
+        avg_motivation_embedding as an ndarray, converted once per embedding
+        list rather than once per problem the team is scored against.
+        """
+        embedding = self.avg_motivation_embedding
+        if not embedding:
+            return None
+        cached = self._embedding_array
+        if cached is None or cached[0] is not embedding:
+            cached = self._embedding_array = (embedding, np.asarray(embedding, dtype=float))
+        return cached[1]
+
+
 async def build_team_vector(team: Team, participants: List[Participant]) -> TeamVector:
     """
     Aggregates participant data into a single team vector.
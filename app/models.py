@@ -1,9 +1,22 @@
+import sys
 from typing import Dict, List, Optional
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
 from datetime import datetime
-from app.config import ALLOWED_ROLES, ALLOWED_SKILLS
+from app.config import ALLOWED_ROLES, ALLOWED_SKILLS, ALLOWED_ROLE_SET, ALLOWED_SKILL_SET
+
+# Payloads reaching these models have already passed JSON-schema validation, so
+# keep the pydantic-core validators lean and build them eagerly at import.
+FAST_MODEL_CONFIG = ConfigDict(
+    populate_by_name=True,
+    validate_assignment=False,
+    extra="ignore",
+    str_strip_whitespace=False,
+    defer_build=False,
+)
 
 class Participant(BaseModel):
+    model_config = FAST_MODEL_CONFIG
+
     version: str
     id: str = Field(..., alias="_id")
     name: str
@@ -21,7 +34,26 @@ class Participant(BaseModel):
         # Validation logic here
         return values
 
+    @field_validator("primary_roles")
+    @classmethod
+    def intern_roles(cls, roles: List[str]) -> List[str]:
+        # Roles and skill names are drawn from small vocabularies and used as
+        # dict keys downstream; interning lets those lookups hit on identity.
+        # Only known names are interned, so client strings can't grow the
+        # interpreter's intern table.
+        return [sys.intern(role) if role in ALLOWED_ROLE_SET else role for role in roles]
+
+    @field_validator("self_rated_skills")
+    @classmethod
+    def intern_skill_names(cls, skills: Dict[str, int]) -> Dict[str, int]:
+        return {
+            sys.intern(name) if name in ALLOWED_SKILL_SET else name: rating
+            for name, rating in skills.items()
+        }
+
 class Problem(BaseModel):
+    model_config = FAST_MODEL_CONFIG
+
     version: str
     id: str = Field(..., alias="_id")
     title: str
@@ -36,24 +68,37 @@ class Problem(BaseModel):
     expected_hours_per_week: int = 20
 
 class Posterior(BaseModel):
+    model_config = FAST_MODEL_CONFIG
+
     mean: float
     std_dev: float
     alpha: float
     beta: float
 
 class GptTraits(BaseModel):
+    model_config = FAST_MODEL_CONFIG
+
     ambiguity_tolerance: float
     communication_style: float
     motivation_style: str
 
 class Team(BaseModel):
+    model_config = FAST_MODEL_CONFIG
+
     id: str = Field(..., alias="_id")
     team_id_str: str
     participant_ids: List[str]
     metrics: Dict[str, float]
 
 class Assignment(BaseModel):
+    model_config = FAST_MODEL_CONFIG
+
     id: Optional[str] = Field(None, alias="_id")
     assignments: Dict[str, str]
     total_cost: float
-    created_at: datetime = Field(default_factory=datetime.utcnow) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# Resolve the forward references on Participant once, rather than lazily on
+# first construction.
+Participant.model_rebuild()
@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 class SkillPosterior:
     """
@@ -11,14 +13,43 @@ class SkillPosterior:
     Attributes:
         alpha (float): The alpha parameter of the Beta distribution, representing successes + 1.
         beta (float): The beta parameter of the Beta distribution, representing failures + 1.
+
+    alpha and beta are read-only; they change only through the `update*`
+    methods, which also invalidate the cached `mean` and `std_dev`.
     """
 
+    __slots__ = ("_alpha", "_beta", "_mean_cache", "_std_cache")
+
     def __init__(self, alpha: float = 1.0, beta: float = 1.0):
         """Initializes with a uniform prior by default (alpha=1, beta=1)."""
         if alpha <= 0 or beta <= 0:
             raise ValueError("Alpha and beta parameters must be positive.")
-        self.alpha = alpha
-        self.beta = beta
+        self._alpha = alpha
+        self._beta = beta
+        self._mean_cache = None
+        self._std_cache = None
+
+    @classmethod
+    def from_rating_fast(cls, rating: int, max_rating: int = 5) -> "SkillPosterior":
+        """
+        Builds the posterior a uniform prior reaches after
+        `update_from_self_rating(rating, max_rating)`, skipping the argument
+        checks. Only use with ratings that have already been schema-validated.
+        """
+        posterior = cls.__new__(cls)
+        posterior._alpha = 1.0 + rating
+        posterior._beta = 1.0 + (max_rating - rating)
+        posterior._mean_cache = None
+        posterior._std_cache = None
+        return posterior
+
+    @property
+    def alpha(self) -> float:
+        return self._alpha
+
+    @property
+    def beta(self) -> float:
+        return self._beta
 
     def update(self, successes: int, failures: int):
         """
@@ -30,8 +61,13 @@ class SkillPosterior:
         """
         if successes < 0 or failures < 0:
             raise ValueError("Successes and failures must be non-negative.")
-        self.alpha += successes
-        self.beta += failures
+        self._add_evidence(successes, failures)
+
+    def _add_evidence(self, successes: float, failures: float):
+        self._alpha += successes
+        self._beta += failures
+        self._mean_cache = None
+        self._std_cache = None
 
     def update_from_self_rating(self, rating: int, max_rating: int = 5):
         """
@@ -69,12 +105,116 @@ class SkillPosterior:
     @property
     def mean(self) -> float:
         """Calculates the mean of the posterior Beta distribution."""
-        return self.alpha / (self.alpha + self.beta)
+        if self._mean_cache is None:
+            self._mean_cache = _beta_mean(self._alpha, self._beta)
+        return self._mean_cache
 
     @property
     def std_dev(self) -> float:
         """Calculates the standard deviation of the posterior Beta distribution."""
-        return math.sqrt(
-            (self.alpha * self.beta)
-            / ((self.alpha + self.beta) ** 2 * (self.alpha + self.beta + 1))
-        ) 
\ No newline at end of file
+        if self._std_cache is None:
+            self._std_cache = _beta_std_dev(self._alpha, self._beta)
+        return self._std_cache
+
+
+def _beta_mean(alpha: float, beta: float) -> float:
+    return alpha / (alpha + beta)
+
+
+def _beta_std_dev(alpha: float, beta: float) -> float:
+    total = alpha + beta
+    return math.sqrt((alpha * beta) / (total * total * (total + 1.0)))
+
+
+class SkillPosteriorBank:
+    """
+    Beta posteriors for a grid of (participant, skill) cells, stored as
+    `alpha` and `beta` arrays of shape (n_participants, n_skills) so that
+    updates and summary statistics run as whole-array operations. Each cell
+    follows the same rules as a `SkillPosterior`.
+    """
+
+    __slots__ = ("alpha", "beta")
+
+    def __init__(self, n_participants: int, n_skills: int):
+        """Initializes every cell with a uniform prior (alpha=1, beta=1)."""
+        self.alpha = np.ones((n_participants, n_skills))
+        self.beta = np.ones((n_participants, n_skills))
+
+    @classmethod
+    def from_ratings(cls, ratings, max_rating: int = 5) -> "SkillPosteriorBank":
+        """Builds a bank whose cells have each been updated from a self-rating."""
+        ratings = np.asarray(ratings, dtype=np.float64)
+        if ratings.ndim != 2:
+            raise ValueError("Ratings must be a 2-D (participants x skills) array.")
+        bank = cls(*ratings.shape)
+        bank.update_from_self_ratings(ratings, max_rating)
+        return bank
+
+    def update(self, successes, failures):
+        """
+        Adds evidence to every cell. `successes` and `failures` broadcast
+        against the bank's shape.
+        """
+        successes = np.asarray(successes)
+        failures = np.asarray(failures)
+        if (successes < 0).any() or (failures < 0).any():
+            raise ValueError("Successes and failures must be non-negative.")
+        np.add(self.alpha, successes, out=self.alpha)
+        np.add(self.beta, failures, out=self.beta)
+
+    def update_from_self_ratings(self, ratings, max_rating: int = 5):
+        """Vectorized `SkillPosterior.update_from_self_rating` over all cells."""
+        ratings = np.asarray(ratings, dtype=np.float64)
+        if ((ratings < 0) | (ratings > max_rating)).any():
+            raise ValueError(f"Rating must be between 0 and {max_rating}.")
+        self.update(ratings, max_rating - ratings)
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Posterior means, one per cell."""
+        return self.alpha / (self.alpha + self.beta)
+
+    @property
+    def std_dev(self) -> np.ndarray:
+        """Posterior standard deviations, one per cell."""
+        total = self.alpha + self.beta
+        return np.sqrt(self.alpha * self.beta / (total * total * (total + 1.0)))
+
+    def posterior(self, participant: int, skill: int) -> SkillPosterior:
+        """
+        A `SkillPosterior` view of one cell: it reads the bank's arrays, and
+        its `update*` methods write back into them.
+        """
+        return _BankCellPosterior(self, (participant, skill))
+
+
+class _BankCellPosterior(SkillPosterior):
+    """`SkillPosterior` backed by one cell of a `SkillPosteriorBank`."""
+
+    __slots__ = ("_bank", "_cell")
+
+    def __init__(self, bank: SkillPosteriorBank, cell):
+        self._bank = bank
+        self._cell = cell
+
+    @property
+    def alpha(self) -> float:
+        return float(self._bank.alpha[self._cell])
+
+    @property
+    def beta(self) -> float:
+        return float(self._bank.beta[self._cell])
+
+    def _add_evidence(self, successes: float, failures: float):
+        self._bank.alpha[self._cell] += successes
+        self._bank.beta[self._cell] += failures
+
+    # The bank can also change underneath the view, so nothing is cached here
+    @property
+    def mean(self) -> float:
+        return _beta_mean(self.alpha, self.beta)
+
+    @property
+    def std_dev(self) -> float:
+        return _beta_std_dev(self.alpha, self.beta)
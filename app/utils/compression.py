@@ -0,0 +1,113 @@
+import zlib
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 16 + MAX_WBITS: expect a gzip header and trailer around the deflate stream
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+class GzipRequestMiddleware:
+    """
+    Inflates request bodies sent with `Content-Encoding: gzip` before they
+    reach the route, so clients can compress large uploads. Starlette's
+    GZipMiddleware only handles the response direction.
+
+    Bodies are inflated incrementally and capped at `max_body_size` bytes, so
+    a small, highly compressed upload cannot expand without bound in memory.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = 64 * 1024 * 1024):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        encoding = dict(scope["headers"]).get(b"content-encoding", b"").lower()
+        if encoding != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        inflater = _GzipInflater(self.max_body_size)
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                if message["type"] != "http.request":
+                    # Client went away mid-upload; hand the disconnect straight on
+                    await self.app(scope, _replay(message, receive), send)
+                    return
+                inflater.feed(message.get("body", b""))
+                more_body = message.get("more_body", False)
+            body = inflater.finish()
+        except _BodyTooLarge:
+            await _plain_response(send, 413, b"Decompressed request body too large")
+            return
+        except zlib.error:
+            await _plain_response(send, 400, b"Malformed gzip request body")
+            return
+
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        scope = dict(scope, headers=headers)
+        await self.app(scope, _replay({"type": "http.request", "body": body, "more_body": False}, receive), send)
+
+
+class _GzipInflater:
+    """
+    Streaming gzip decoder that raises _BodyTooLarge as soon as the output
+    would exceed `limit` bytes. Handles multi-member streams like gzip.decompress.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.size = 0
+        self.parts = []
+        self.decompressor = zlib.decompressobj(_GZIP_WBITS)
+
+    def feed(self, data: bytes) -> None:
+        while data:
+            # Ask for one byte past the limit: getting it means the body is too big
+            chunk = self.decompressor.decompress(data, self.limit - self.size + 1)
+            self.size += len(chunk)
+            if self.size > self.limit:
+                raise _BodyTooLarge()
+            self.parts.append(chunk)
+            if self.decompressor.eof:
+                # Another gzip member may follow the one that just ended
+                data = self.decompressor.unused_data
+                if data:
+                    self.decompressor = zlib.decompressobj(_GZIP_WBITS)
+            else:
+                data = self.decompressor.unconsumed_tail
+
+    def finish(self) -> bytes:
+        if not self.decompressor.eof:
+            raise zlib.error("truncated gzip stream")
+        return b"".join(self.parts)
+
+
+async def _plain_response(send: Send, status: int, body: bytes) -> None:
+    await send({"type": "http.response.start", "status": status,
+                "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _replay(first: Message, receive: Receive) -> Receive:
+    """A receive callable that yields `first` once, then defers to `receive`."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return first
+        return await receive()
+
+    return replay
@@ -1,8 +1,9 @@
 import json
+import numbers
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 
-import jsonschema
 from fastapi import HTTPException
 from jsonschema import Draft7Validator
 from pydantic import ValidationError as PydanticValidationError
@@ -13,15 +14,166 @@ SCHEMA_DIR = Path(__file__).parent.parent / "schema"
 PARTICIPANT_SCHEMA_PATH = SCHEMA_DIR / "participant_form.schema.json"
 PROBLEM_SCHEMA_PATH = SCHEMA_DIR / "problem_form.schema.json"
 
+# Keywords the fast-check generator understands, per JSON type. Anything else
+# makes it give up on the schema and leave validation to jsonschema.
+_ANNOTATION_KEYWORDS = frozenset({"$schema", "title", "description", "format"})
+_KEYWORDS_BY_TYPE = {
+    "object": frozenset({"properties", "required", "additionalProperties", "patternProperties"}),
+    "array": frozenset({"items", "minItems", "maxItems", "uniqueItems"}),
+    "string": frozenset({"enum", "minLength", "maxLength"}),
+    "integer": frozenset({"minimum", "maximum"}),
+    "number": frozenset({"minimum", "maximum"}),
+}
+# Mirrors jsonschema's Draft 7 type checker (bools are not numbers, integral
+# floats are integers).
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": (
+        "(isinstance({v}, int) and not isinstance({v}, bool)"
+        " or isinstance({v}, float) and {v}.is_integer())"
+    ),
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+}
+
+
+class _UnsupportedSchema(Exception):
+    pass
+
+
+class _FastCheckBuilder:
+    """
+    Partially evaluates a JSON schema into the source of a specialised
+    predicate: required keys are unrolled, enums become frozenset lookups and
+    patterns are precompiled.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {"_Number": numbers.Number}
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _const(self, prefix: str, value: Any) -> str:
+        name = self._name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def _fail_unless(self, condition: str, indent: int) -> None:
+        self.lines.append(f"{'    ' * indent}if not ({condition}): return False")
+
+    def emit(self, schema: Dict[str, Any], var: str, indent: int) -> None:
+        schema_type = schema.get("type")
+        if schema_type not in _TYPE_CHECKS:
+            raise _UnsupportedSchema(f"type {schema_type!r}")
+        unknown = set(schema) - _ANNOTATION_KEYWORDS - {"type"} - _KEYWORDS_BY_TYPE[schema_type]
+        if unknown:
+            raise _UnsupportedSchema(", ".join(sorted(unknown)))
+
+        self._fail_unless(_TYPE_CHECKS[schema_type].format(v=var), indent)
+
+        if "enum" in schema:
+            if not all(isinstance(value, str) for value in schema["enum"]):
+                raise _UnsupportedSchema("non-string enum")
+            self._fail_unless(f"{var} in {self._const('_enum', frozenset(schema['enum']))}", indent)
+        if "minLength" in schema:
+            self._fail_unless(f"len({var}) >= {schema['minLength']!r}", indent)
+        if "maxLength" in schema:
+            self._fail_unless(f"len({var}) <= {schema['maxLength']!r}", indent)
+        if "minimum" in schema:
+            self._fail_unless(f"{var} >= {schema['minimum']!r}", indent)
+        if "maximum" in schema:
+            self._fail_unless(f"{var} <= {schema['maximum']!r}", indent)
+
+        if schema_type == "array":
+            self._emit_array(schema, var, indent)
+        elif schema_type == "object":
+            self._emit_object(schema, var, indent)
+
+    def _emit_array(self, schema: Dict[str, Any], var: str, indent: int) -> None:
+        pad = "    " * indent
+        if "minItems" in schema:
+            self._fail_unless(f"len({var}) >= {schema['minItems']!r}", indent)
+        if "maxItems" in schema:
+            self._fail_unless(f"len({var}) <= {schema['maxItems']!r}", indent)
+        items = schema.get("items")
+        if items is not None:
+            if not isinstance(items, dict):
+                raise _UnsupportedSchema("tuple items")
+            item = self._name("v")
+            self.lines.append(f"{pad}for {item} in {var}:")
+            self.emit(items, item, indent + 1)
+        if schema.get("uniqueItems"):
+            # A set comparison is only equivalent for hashable, non-numeric items.
+            if items is None or items.get("type") != "string":
+                raise _UnsupportedSchema("uniqueItems on non-string items")
+            self._fail_unless(f"len(set({var})) == len({var})", indent)
+
+    def _emit_object(self, schema: Dict[str, Any], var: str, indent: int) -> None:
+        pad = "    " * indent
+        properties = schema.get("properties", {})
+        patterns = schema.get("patternProperties", {})
+        additional = schema.get("additionalProperties", True)
+        if not isinstance(additional, bool):
+            raise _UnsupportedSchema("additionalProperties schema")
+
+        for key in schema.get("required", []):
+            self._fail_unless(f"{key!r} in {var}", indent)
+
+        for key, subschema in properties.items():
+            value = self._name("v")
+            self.lines.append(f"{pad}if {key!r} in {var}:")
+            self.lines.append(f"{pad}    {value} = {var}[{key!r}]")
+            self.emit(subschema, value, indent + 1)
+
+        if not patterns and additional:
+            return
+        key, value, matched = self._name("k"), self._name("v"), self._name("matched")
+        self.lines.append(f"{pad}for {key}, {value} in {var}.items():")
+        if not additional:
+            known = self._const("_props", frozenset(properties))
+            self.lines.append(f"{pad}    {matched} = {key} in {known}")
+        for pattern, subschema in patterns.items():
+            regex = self._const("_pattern", re.compile(pattern))
+            self.lines.append(f"{pad}    if {regex}.search({key}):")
+            if not additional:
+                self.lines.append(f"{pad}        {matched} = True")
+            self.emit(subschema, value, indent + 2)
+        if not additional:
+            self._fail_unless(matched, indent + 1)
+
+
+def _compile_fast_check(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    Generates and `exec`s a predicate that returns True iff `schema` accepts the
+    instance. Returns None when the schema uses keywords the generator does not
+    support, in which case callers should rely on the generic validator alone.
+    """
+    builder = _FastCheckBuilder()
+    try:
+        builder.emit(schema, "v0", 1)
+    except _UnsupportedSchema:
+        return None
+    source = "\n".join(["def _fast_check(v0):", *builder.lines, "    return True"])
+    exec(compile(source, f"<fast-check {schema.get('title', '')}>", "exec"), builder.namespace)
+    return builder.namespace["_fast_check"]
+
+
 with open(PARTICIPANT_SCHEMA_PATH) as f:
     participant_schema = json.load(f)
     Draft7Validator.check_schema(participant_schema)
     participant_validator = Draft7Validator(participant_schema)
+    participant_fast_check = _compile_fast_check(participant_schema)
 
 with open(PROBLEM_SCHEMA_PATH) as f:
     problem_schema = json.load(f)
     Draft7Validator.check_schema(problem_schema)
     problem_validator = Draft7Validator(problem_schema)
+    problem_fast_check = _compile_fast_check(problem_schema)
 
 
 def _format_jsonschema_errors(errors):
@@ -37,17 +189,36 @@ def _format_jsonschema_errors(errors):
     return error_details
 
 
+def _check_schema(
+    validator: Draft7Validator,
+    fast_check: Optional[Callable[[Any], bool]],
+    data: Dict[str, Any],
+) -> None:
+    # The specialised check accepts valid payloads cheaply; anything it rejects
+    # goes through jsonschema so error reporting stays identical.
+    if fast_check is not None and fast_check(data):
+        return
+    # Only materialise and sort the error list once we know there is at least
+    # one error.
+    errors = validator.iter_errors(data)
+    first = next(errors, None)
+    if first is not None:
+        raise HTTPException(
+            status_code=422, detail=_format_jsonschema_errors([first, *errors])
+        )
+
+
 def validate_participant(data: Dict[str, Any]) -> Participant:
+    _check_schema(participant_validator, participant_fast_check, data)
     try:
-        jsonschema.validate(instance=data, schema=participant_schema)
-        return Participant(**data)
-    except (jsonschema.exceptions.ValidationError, PydanticValidationError) as e:
+        return Participant.model_validate(data)
+    except PydanticValidationError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
 
 def validate_problem(data: Dict[str, Any]) -> Problem:
+    _check_schema(problem_validator, problem_fast_check, data)
     try:
-        jsonschema.validate(instance=data, schema=problem_schema)
-        return Problem(**data)
-    except (jsonschema.exceptions.ValidationError, PydanticValidationError) as e:
+        return Problem.model_validate(data)
+    except PydanticValidationError as e:
         raise HTTPException(status_code=422, detail=str(e)) 
\ No newline at end of file
@@ -0,0 +1,47 @@
+import asyncio
+import os
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+from celery.signals import worker_process_init
+
+from app.db import bind_client_to_running_loop
+
+T = TypeVar("T")
+
+# One event loop per worker process, running in a daemon thread for the life of
+# the process. The shared Motor client binds to the first loop that uses it, so
+# every task must run its coroutines on this same loop rather than a fresh one.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    This process's persistent event loop, started on first use. A forked
+    child never reuses its parent's loop; it starts its own.
+    """
+    global _loop, _loop_pid
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="worker-event-loop", daemon=True).start()
+            asyncio.run_coroutine_threadsafe(bind_client_to_running_loop(), loop).result()
+            _loop, _loop_pid = loop, os.getpid()
+        return _loop
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """
+    Runs `awaitable` on the worker's persistent loop and blocks until it
+    finishes. Safe to call from any pool thread.
+    """
+    return asyncio.run_coroutine_threadsafe(awaitable, get_worker_loop()).result()
+
+
+@worker_process_init.connect
+def _start_worker_loop(**kwargs) -> None:
+    # Start the loop (and bind the Mongo client to it) before the first task,
+    # in each forked pool process.
+    get_worker_loop()
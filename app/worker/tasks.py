@@ -1,18 +1,23 @@
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 import redis
 from datetime import datetime
 
 from celery.exceptions import Reject
 from pydantic import ValidationError
+from pymongo import DeleteMany, InsertOne
 
 from app.scoring.bayes import SkillPosterior
 from app.utils.validate import validate_participant
 from app.worker.celery_app import celery_app
+from app.worker.event_loop import run_async
 from app.matching.build_matrix import build_individual_problem_matrix
+from app.matching.cost import normalize_embedding
+from app.matching.pairwise import pair_cost_cache
 from app.matching.hungarian_capacity import solve_hungarian_capacity
 from app.matching.team_builder import build_provisional_teams
-from app.matching.slot_solver import solve_team_slots, calculate_team_coverage_metrics
+from app.matching.slot_solver import solve_team_slots, calculate_all_team_coverage_metrics
 from app.db import db
 from app.llm.openai_client import get_gpt_analysis, get_embedding
 from app.vector.pinecone_client import pinecone_client
@@ -22,7 +27,7 @@ redis_client = redis.Redis(host='localhost', port=6379, db=0)
 
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
-async def score_participant(self, participant_payload: Dict[str, Any]):
+def score_participant(self, participant_payload: Dict[str, Any]):
     try:
         participant = validate_participant(participant_payload)
     except ValidationError as e:
@@ -32,8 +37,9 @@ async def score_participant(self, participant_payload: Dict[str, Any]):
     enriched_skills = {}
     for skill_name, self_rating in participant.self_rated_skills.items():
         try:
-            posterior = SkillPosterior()
-            posterior.update_from_self_rating(self_rating)
+            # Ratings are bounded by the participant schema, so skip the
+            # per-update argument checks.
+            posterior = SkillPosterior.from_rating_fast(self_rating)
             # In the future, other evidence sources will be added here.
             enriched_skills[skill_name] = {
                 "mean": posterior.mean,
@@ -52,16 +58,11 @@ async def score_participant(self, participant_payload: Dict[str, Any]):
     enriched_participant = participant.dict()
     enriched_participant["enriched_skills"] = enriched_skills
     
-    # Get GPT analysis and embedding
-    gpt_analysis = await get_gpt_analysis(participant.motivation_text)
+    # Get GPT analysis and embedding, and upsert to Pinecone
+    gpt_analysis, motivation_embedding = run_async(_enrich_participant(participant))
     enriched_participant["gpt_traits"] = gpt_analysis
-    
-    motivation_embedding = await get_embedding(participant.motivation_text)
     enriched_participant["motivation_embedding"] = motivation_embedding
     
-    # Upsert to Pinecone
-    await pinecone_client.upsert_vectors([(str(participant.id), np.array(motivation_embedding))])
-    
     logger.info(
         f"Successfully scored participant {participant.email}"
     )
@@ -69,12 +70,35 @@ async def score_participant(self, participant_payload: Dict[str, Any]):
     return enriched_participant
 
 
+async def _enrich_participant(participant) -> Tuple[Dict[str, Any], Optional[List[float]]]:
+    """
+    All awaited I/O for `score_participant`, run through a single
+    `run_async` call per task.
+    """
+    gpt_analysis = await get_gpt_analysis(participant.motivation_text)
+    motivation_embedding = await get_embedding(participant.motivation_text)
+    if not motivation_embedding:
+        logger.error(f"Could not generate embedding for participant {participant.id}")
+        return gpt_analysis, motivation_embedding
+
+    motivation_embedding = normalize_embedding(motivation_embedding)
+    # float32 matches the embedding model's precision and halves the buffer size
+    await pinecone_client.upsert_vectors(
+        [(str(participant.id), np.asarray(motivation_embedding, dtype=np.float32))]
+    )
+    return gpt_analysis, motivation_embedding
+
+
 @celery_app.task(bind=True)
-async def run_stage_one(self):
+def run_stage_one(self):
     """
     Builds the individual-problem cost matrix, runs the Hungarian capacity
     solver, and stores the preliminary clusters in MongoDB.
     """
+    return run_async(_run_stage_one())
+
+
+async def _run_stage_one():
     redis_pubsub = redis_client.pubsub()
 
     def post_message(message: str):
@@ -112,10 +136,14 @@ async def run_stage_one(self):
 
 
 @celery_app.task(bind=True)
-async def run_stage_two(self):
+def run_stage_two(self):
     """
     Build final teams from preliminary clusters using internal team formation.
     """
+    return run_async(_run_stage_two())
+
+
+async def _run_stage_two():
     redis_pubsub = redis_client.pubsub()
 
     def post_message(message: str):
@@ -139,6 +167,13 @@ async def run_stage_two(self):
         
         post_message("Converting assignments to team clusters...")
         
+        # Fetch every assigned participant in one query rather than one per assignment
+        participant_ids = [assignment.get("participant_id") for assignment in assignments]
+        participants_by_id = {
+            participant["_id"]: participant
+            async for participant in db.participants.find({"_id": {"$in": participant_ids}})
+        }
+        
         # Group participants by problem assignment
         problem_clusters = {}
         for assignment in assignments:
@@ -148,8 +183,7 @@ async def run_stage_two(self):
             if problem_id not in problem_clusters:
                 problem_clusters[problem_id] = []
             
-            # Fetch participant data
-            participant = await db.participants.find_one({"_id": participant_id})
+            participant = participants_by_id.get(participant_id)
             if participant:
                 problem_clusters[problem_id].append(participant)
         
@@ -158,36 +192,38 @@ async def run_stage_two(self):
         
         post_message(f"Found {len(prelim_teams)} preliminary clusters. Building provisional teams...")
         
-        # Build provisional teams using k-medoids clustering
-        provisional_teams = build_provisional_teams(
-            prelim_teams=prelim_teams,
-            desired_team_size=4,
-            max_iter=100,
-            random_seed=42
-        )
-        
-        post_message(f"Built {len(provisional_teams)} provisional teams. Optimizing with slot solver...")
-        
         # Get all participants for slot filling
         all_participants = []
         async for participant in db.participants.find({}):
             all_participants.append(participant)
         
-        # Solve final team slots
-        final_teams = solve_team_slots(
-            teams=provisional_teams,
-            available_participants=all_participants,
-            target_team_size=4,
-            role_coverage_threshold=0.6
-        )
+        # Records are fixed from here on, so pair costs can be reused across
+        # clustering and slot filling
+        with pair_cost_cache():
+            # Build provisional teams using k-medoids clustering
+            provisional_teams = build_provisional_teams(
+                prelim_teams=prelim_teams,
+                desired_team_size=4,
+                max_iter=100,
+                random_seed=42
+            )
+            
+            post_message(f"Built {len(provisional_teams)} provisional teams. Optimizing with slot solver...")
+            
+            # Solve final team slots
+            final_teams = solve_team_slots(
+                teams=provisional_teams,
+                available_participants=all_participants,
+                target_team_size=4,
+                role_coverage_threshold=0.6
+            )
         
         post_message("Calculating team metrics...")
         
-        # Calculate metrics for each team
+        # Calculate metrics for all teams in one batched pass
         team_documents = []
-        for i, team in enumerate(final_teams):
-            metrics = calculate_team_coverage_metrics(team)
-            
+        all_metrics = calculate_all_team_coverage_metrics(final_teams)
+        for i, (team, metrics) in enumerate(zip(final_teams, all_metrics)):
             team_doc = {
                 "team_id": f"team_{i+1}",
                 "members": [
@@ -210,10 +246,11 @@ async def run_stage_two(self):
             }
             team_documents.append(team_doc)
         
-        # Store final teams in MongoDB
-        await db.final_teams.delete_many({})
-        if team_documents:
-            await db.final_teams.insert_many(team_documents)
+        # Replace the stored final teams in a single bulk round trip
+        await db.final_teams.bulk_write(
+            [DeleteMany({})] + [InsertOne(doc) for doc in team_documents],
+            ordered=True,
+        )
         
         # Publish progress update
         summary = {
@@ -241,10 +278,14 @@ async def run_stage_two(self):
 
 
 @celery_app.task(bind=True)
-async def run_stage_three(self):
+def run_stage_three(self):
     """
     Execute final team-to-problem assignment using Hungarian algorithm.
     """
+    return run_async(_run_stage_three())
+
+
+async def _run_stage_three():
     redis_pubsub = redis_client.pubsub()
 
     def post_message(message: str):
@@ -30,29 +30,149 @@ Use --manual-docker flag to manage Docker services yourself.
 
 import argparse
 import json
+import socket
+import os
+import gzip
 import time
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3.response
+from urllib3.util.retry import Retry
 import subprocess
 import signal
 import atexit
+import collections
+import threading
+import mmap
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson
+    
+    def json_dumps(obj: Any) -> bytes:
+        # NumPy arrays (e.g. precomputed embeddings) are encoded natively
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json produces the same payloads
+    def _encode_array(obj: Any) -> Any:
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_encode_array).encode("utf-8")
+    
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large files are then parsed in one go
+    ijson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError; ijson raises its own hierarchy
+JSON_DECODE_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+try:
+    from websockets.sync.client import connect as ws_connect
+    from websockets.exceptions import ConnectionClosed, InvalidHandshake
+except ImportError:  # websockets is optional; status falls back to HTTP polling
+    ws_connect = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Docker compose startup: health is probed every second; this many output lines are kept
+SERVICE_START_TIMEOUT = 120
+SERVICE_POLL_INTERVAL = 1.0
+COMPOSE_OUTPUT_LINES = 200
+COMPOSE_READ_SIZE = 65536
+PORT_PROBE_TIMEOUT = 0.5
+
+# Only advertise zstd responses when urllib3 can decode them (urllib3 >= 2.0)
+ACCEPT_ENCODING = "zstd, gzip, deflate" if getattr(urllib3.response, "HAS_ZSTD", False) else "gzip, deflate"
+
+# Default concurrent per-item uploads, never more than the pool can keep alive
+UPLOAD_WORKERS = min(16, POOL_MAXSIZE)
+
+# Per-item upload progress is logged at INFO once every this many items
+PROGRESS_LOG_EVERY = 100
+
+# Healthy probe results are reused across runs for this long
+HEALTH_CACHE_PATH = Path.home() / ".cache" / "matchmaking_tester.json"
+HEALTH_CACHE_TTL = 60.0
+
+# Input files above this size are stream-parsed from a memory map when ijson is available
+STREAM_PARSE_THRESHOLD = 8 * 1024 * 1024
+LEADING_WHITESPACE = re.compile(rb'\s*')
+
+# Seconds a long-polling status request may be held open by the server
+LONG_POLL_WAIT = 30
+
+# Short-polling backoff: start fast so quick phases are noticed promptly
+POLL_INITIAL_DELAY = 0.2
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_DELAY = 5.0
+
 class MatchmakingTester:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", upload_workers: int = UPLOAD_WORKERS,
+                 compress_uploads: Optional[str] = None, compose_files: Optional[List[str]] = None):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.compose_files = compose_files or []
+        self.upload_workers = max(1, min(upload_workers, POOL_MAXSIZE))
+        # Upload Content-Encoding: "gzip" (the only one the backend inflates) or None
+        self.compress_uploads = compress_uploads
+        self.session = self._build_session()
         self.docker_process = None
+        # Last lines of docker compose output, kept for error reporting
+        self._compose_output = collections.deque(maxlen=COMPOSE_OUTPUT_LINES)
+        self._compose_drain_thread = None
         
         # Register cleanup function
         atexit.register(self.cleanup)
         
+    def __enter__(self) -> "MatchmakingTester":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.session.close()
+    
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create a keep-alive session whose pool is large enough for concurrent requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            # Wait for a pooled keep-alive socket rather than opening throwaway connections
+            pool_block=True,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET", "POST", "DELETE"],
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        })
+        return session
+
     def check_docker_available(self) -> bool:
         """Check if Docker is available and running."""
         try:
@@ -82,51 +202,75 @@ class MatchmakingTester:
             logger.error(f"❌ Error checking Docker: {e}")
             return False
     
+    def _drain_compose_output(self):
+        """Read docker compose output until it exits, keeping only the most recent lines.
+
+        Reads raw bytes in large chunks; lines are only decoded when reported.
+        """
+        fd = self.docker_process.stdout.fileno()
+        pending = b""
+        while True:
+            chunk = os.read(fd, COMPOSE_READ_SIZE)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            self._compose_output.extend(lines)
+        if pending:
+            self._compose_output.append(pending)
+    
+    def _compose_output_text(self) -> str:
+        """The retained docker compose output, decoded for logging."""
+        return b"\n".join(self._compose_output).decode("utf-8", errors="replace").strip()
+    
     def start_services(self) -> bool:
         """Start Docker services using docker compose."""
         logger.info("🚀 Starting Docker services...")
         
         try:
             # Check if services are already running
-            if self.check_backend_health():
+            if self.cached_backend_health():
                 logger.info("✅ Services are already running")
                 return True
             
             # Start docker compose in the background
-            logger.info("   Starting: docker compose up --build")
+            command = ['docker', 'compose']
+            for compose_file in self.compose_files:
+                command += ['-f', compose_file]
+            command += ['up', '--build']
+            logger.info(f"   Starting: {' '.join(command)}")
             self.docker_process = subprocess.Popen(
-                ['docker', 'compose', 'up', '--build'],
+                command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0
             )
+            # Keep draining compose output so a full pipe never stalls docker
+            self._compose_drain_thread = threading.Thread(target=self._drain_compose_output, daemon=True)
+            self._compose_drain_thread.start()
             
             # Wait for services to be ready
             logger.info("   Waiting for services to be ready...")
-            max_wait = 120  # 2 minutes
-            wait_interval = 5
-            
-            for i in range(0, max_wait, wait_interval):
+            start_time = time.monotonic()
+            polls = 0
+            while time.monotonic() - start_time < SERVICE_START_TIMEOUT:
                 if self.docker_process.poll() is not None:
-                    # Process has terminated - get the output
-                    stdout, stderr = self.docker_process.communicate()
+                    # Process has terminated - report the tail of its output
+                    self._compose_drain_thread.join(timeout=1)
                     logger.error("❌ Docker compose process terminated unexpectedly")
-                    if stdout:
-                        logger.error(f"   Output: {stdout.strip()}")
-                    if stderr:
-                        logger.error(f"   Error: {stderr.strip()}")
+                    if self._compose_output:
+                        logger.error(f"   Output: {self._compose_output_text()}")
                     return False
                 
                 if self.check_backend_health():
-                    logger.info(f"✅ Services are ready after {i + wait_interval} seconds")
+                    logger.info(f"✅ Services are ready after {time.monotonic() - start_time:.0f} seconds")
                     return True
                 
-                logger.info(f"   Still waiting... ({i + wait_interval}s elapsed)")
-                time.sleep(wait_interval)
+                polls += 1
+                if polls % 5 == 0:
+                    logger.info(f"   Still waiting... ({time.monotonic() - start_time:.0f}s elapsed)")
+                time.sleep(SERVICE_POLL_INTERVAL)
             
-            logger.error(f"❌ Services failed to start within {max_wait} seconds")
+            logger.error(f"❌ Services failed to start within {SERVICE_START_TIMEOUT} seconds")
             return False
             
         except FileNotFoundError:
@@ -156,8 +300,22 @@ class MatchmakingTester:
             except Exception as e:
                 logger.warning(f"⚠️  Error stopping Docker services: {e}")
     
+    def _port_open(self) -> bool:
+        """Cheap TCP probe: is anything accepting connections at base_url yet?"""
+        url = urlsplit(self.base_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        try:
+            with socket.create_connection((url.hostname, port), timeout=PORT_PROBE_TIMEOUT):
+                return True
+        except OSError:
+            return False
+    
     def check_backend_health(self) -> bool:
         """Check if the backend services are running."""
+        # While the port is still closed, skip the HTTP request (and its
+        # connection-error retries) entirely
+        if not self._port_open():
+            return False
         try:
             response = self.session.get(f"{self.base_url}/health-check", timeout=5)
             if response.status_code == 200:
@@ -167,6 +325,51 @@ class MatchmakingTester:
         except requests.exceptions.RequestException:
             return False
     
+    def cached_backend_health(self) -> bool:
+        """Health check that reuses a recent healthy result recorded on disk."""
+        try:
+            cache = json_loads(HEALTH_CACHE_PATH.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        
+        # The cache outlives this process, so it needs wall-clock time; monotonic
+        # clocks restart from an arbitrary origin on every boot
+        checked_at = cache.get(self.base_url)
+        if isinstance(checked_at, (int, float)) and 0 <= time.time() - checked_at < HEALTH_CACHE_TTL:
+            return True
+        
+        if not self.check_backend_health():
+            return False
+        
+        try:
+            cache[self.base_url] = time.time()
+            HEALTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            HEALTH_CACHE_PATH.write_bytes(json_dumps(cache))
+        except OSError as e:
+            logger.debug(f"Could not write health cache: {e}")
+        return True
+    
+    def check_backend_ready(self) -> bool:
+        """Check the readiness endpoint, falling back to the health check if it is missing."""
+        try:
+            response = self.session.get(f"{self.base_url}/api/state/ready", timeout=5)
+        except requests.exceptions.RequestException:
+            return False
+        if response.status_code == 404:
+            return self.check_backend_health()
+        return response.status_code == 200
+    
+    def wait_until_ready(self, timeout: float = 10.0, interval: float = 0.2) -> bool:
+        """Poll readiness until the backend is quiescent or the timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.check_backend_ready():
+                return True
+            time.sleep(interval)
+        return False
+    
     def clear_database(self) -> bool:
         """Clear all existing data from the database."""
         logger.info("🗑️  Clearing existing database data...")
@@ -176,20 +379,38 @@ class MatchmakingTester:
             "final_teams", "final_assignments", "team_vectors"
         ]
         
-        for collection in collections:
-            try:
-                response = self.session.delete(f"{self.base_url}/api/clear/{collection}")
-                if response.status_code in [200, 404]:
-                    logger.info(f"   Cleared {collection}")
-                else:
-                    logger.warning(f"   Failed to clear {collection}: HTTP {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"   Error clearing {collection}: {e}")
-        
-        time.sleep(2)  # Give database time to process
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            futures = {
+                executor.submit(self.session.delete, f"{self.base_url}/api/clear/{collection}", timeout=10): collection
+                for collection in collections
+            }
+            for future in as_completed(futures):
+                collection = futures[future]
+                try:
+                    response = future.result()
+                    if response.status_code in [200, 404]:
+                        logger.info(f"   Cleared {collection}")
+                    else:
+                        logger.warning(f"   Failed to clear {collection}: HTTP {response.status_code}")
+                except requests.exceptions.RequestException as e:
+                    logger.warning(f"   Error clearing {collection}: {e}")
+        
+        # Wait for the backend to answer again instead of sleeping a fixed interval
+        if not self.wait_until_ready():
+            logger.warning("   Backend did not report ready after clearing")
         logger.info("✅ Database cleared")
         return True
     
+    @staticmethod
+    def _stream_json_array(path: Path) -> Any:
+        """Parse a top-level JSON array item by item from a read-only memory map."""
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # ijson only yields array elements, so hand anything else to the eager parser
+            start = LEADING_WHITESPACE.match(mm).end()
+            if mm[start:start + 1] != b'[':
+                return json_loads(mm[:])
+            return list(ijson.items(mm, 'item', use_float=True))
+    
     def load_json_file(self, filepath: str) -> List[Dict[str, Any]]:
         """Load and validate JSON file."""
         try:
@@ -197,8 +418,10 @@ class MatchmakingTester:
             if not path.exists():
                 raise FileNotFoundError(f"File not found: {filepath}")
             
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if ijson is not None and path.stat().st_size > STREAM_PARSE_THRESHOLD:
+                data = self._stream_json_array(path)
+            else:
+                data = json_loads(path.read_bytes())
             
             if not isinstance(data, list):
                 raise ValueError(f"JSON file must contain a list of objects, got {type(data)}")
@@ -206,35 +429,126 @@ class MatchmakingTester:
             logger.info(f"📁 Loaded {len(data)} items from {filepath}")
             return data
         
-        except json.JSONDecodeError as e:
+        except JSON_DECODE_ERRORS as e:
             logger.error(f"❌ Invalid JSON in {filepath}: {e}")
             raise
         except Exception as e:
             logger.error(f"❌ Error loading {filepath}: {e}")
             raise
     
+    def _encode_body(self, obj: Any) -> bytes:
+        """Serialize an upload body, compressing it when enabled."""
+        body = json_dumps(obj)
+        if self.compress_uploads == "gzip":
+            # Level 1: nearly the full ratio on repetitive JSON at the best throughput
+            body = gzip.compress(body, compresslevel=1)
+        return body
+    
+    def _upload_headers(self) -> Dict[str, str]:
+        """Headers describing upload bodies produced by _encode_body."""
+        headers = {"Content-Type": "application/json"}
+        if self.compress_uploads:
+            headers["Content-Encoding"] = self.compress_uploads
+        return headers
+    
+    def _post_batch(self, path: str, items: List[Dict[str, Any]]) -> Optional[bool]:
+        """POST every item in one request body.
+
+        Returns None when the backend does not expose the batch endpoint so the
+        caller can fall back to per-item uploads.
+        """
+        payload = self._encode_body({"items": items})
+        try:
+            response = self.session.post(
+                f"{self.base_url}{path}",
+                data=payload,
+                headers=self._upload_headers(),
+                timeout=60
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"   ❌ Error uploading batch to {path}: {e}")
+            return False
+        
+        if response.status_code in [404, 405]:
+            return None
+        if response.status_code in [200, 201]:
+            return True
+        
+        logger.error(f"   ❌ Failed to upload batch to {path}: HTTP {response.status_code}")
+        logger.error(f"   Response: {response.text}")
+        return False
+    
+    def _post_one(self, template: requests.PreparedRequest, item: Dict[str, Any]) -> Tuple[bool, str]:
+        """POST a single item using a copy of a request prepared once per endpoint."""
+        prepared = template.copy()
+        prepared.body = self._encode_body(item)
+        prepared.headers['Content-Length'] = str(len(prepared.body))
+        try:
+            response = self.session.send(prepared, timeout=10)
+        except requests.exceptions.RequestException as e:
+            return False, str(e)
+        
+        if response.status_code in [200, 201]:
+            return True, ""
+        return False, f"HTTP {response.status_code}: {response.text}"
+    
+    def _upload_each(self, path: str, items: List[Dict[str, Any]], kind: str, label_key: str) -> bool:
+        """Upload items concurrently over the pooled session.
+        
+        Every item is attempted; failures are reported by index once all
+        uploads have finished.
+        """
+        # URL parsing and session header/cookie merging happen once, not per item
+        template = self.session.prepare_request(
+            requests.Request('POST', f"{self.base_url}{path}", headers=self._upload_headers())
+        )
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            futures = {
+                executor.submit(self._post_one, template, item): (i, item)
+                for i, item in enumerate(items, 1)
+            }
+            uploaded = 0
+            failures = []
+            for future in as_completed(futures):
+                i, item = futures[future]
+                ok, error = future.result()
+                if not ok:
+                    failures.append((i, error))
+                    continue
+                
+                uploaded += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"   ✅ Uploaded {kind} {i}/{len(items)}: {item.get(label_key, 'Unknown')}")
+                if uploaded % PROGRESS_LOG_EVERY == 0:
+                    logger.info(f"   ✅ Uploaded {uploaded}/{len(items)} {kind}s")
+        
+        for i, error in sorted(failures):
+            logger.error(f"   ❌ Failed to upload {kind} {i}: {error}")
+        if failures:
+            logger.error(f"   ❌ {len(failures)}/{len(items)} {kind} uploads failed")
+        return not failures
+    
+    def upload_participants_batch(self, participants: List[Dict[str, Any]]) -> Optional[bool]:
+        """Upload all participants in a single request, or None if unsupported."""
+        return self._post_batch("/api/participants/batch", participants)
+    
+    def upload_problems_batch(self, problems: List[Dict[str, Any]]) -> Optional[bool]:
+        """Upload all problems in a single request, or None if unsupported."""
+        return self._post_batch("/api/problems/batch", problems)
+    
     def upload_participants(self, participants: List[Dict[str, Any]]) -> bool:
         """Upload participants to the backend."""
         logger.info(f"👥 Uploading {len(participants)} participants...")
         
-        for i, participant in enumerate(participants, 1):
-            try:
-                response = self.session.post(
-                    f"{self.base_url}/api/participants",
-                    json=participant,
-                    timeout=10
-                )
-                
-                if response.status_code in [200, 201]:
-                    logger.info(f"   ✅ Uploaded participant {i}/{len(participants)}: {participant.get('name', 'Unknown')}")
-                else:
-                    logger.error(f"   ❌ Failed to upload participant {i}: HTTP {response.status_code}")
-                    logger.error(f"   Response: {response.text}")
-                    return False
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"   ❌ Error uploading participant {i}: {e}")
-                return False
+        batch_result = self.upload_participants_batch(participants)
+        if batch_result is not None:
+            if batch_result:
+                logger.info("✅ All participants uploaded successfully")
+            return batch_result
+        
+        logger.info("   Batch endpoint unavailable, uploading participants one by one")
+        if not self._upload_each("/api/participants", participants, "participant", "name"):
+            return False
         
         logger.info("✅ All participants uploaded successfully")
         return True
@@ -243,28 +557,124 @@ class MatchmakingTester:
         """Upload problems to the backend."""
         logger.info(f"🧩 Uploading {len(problems)} problems...")
         
-        for i, problem in enumerate(problems, 1):
-            try:
-                response = self.session.post(
-                    f"{self.base_url}/api/problems",
-                    json=problem,
-                    timeout=10
-                )
-                
-                if response.status_code in [200, 201]:
-                    logger.info(f"   ✅ Uploaded problem {i}/{len(problems)}: {problem.get('title', 'Unknown')}")
-                else:
-                    logger.error(f"   ❌ Failed to upload problem {i}: HTTP {response.status_code}")
-                    logger.error(f"   Response: {response.text}")
-                    return False
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"   ❌ Error uploading problem {i}: {e}")
-                return False
+        batch_result = self.upload_problems_batch(problems)
+        if batch_result is not None:
+            if batch_result:
+                logger.info("✅ All problems uploaded successfully")
+            return batch_result
+        
+        logger.info("   Batch endpoint unavailable, uploading problems one by one")
+        if not self._upload_each("/api/problems", problems, "problem", "title"):
+            return False
         
         logger.info("✅ All problems uploaded successfully")
         return True
     
+    def upload_all(self, participants: List[Dict[str, Any]], problems: List[Dict[str, Any]]) -> bool:
+        """Upload participants and problems concurrently; both must succeed."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            participants_future = executor.submit(self.upload_participants, participants)
+            problems_future = executor.submit(self.upload_problems, problems)
+            return participants_future.result() and problems_future.result()
+    
+    def _finished_phase_outcome(self, phase: int, status_data: Dict[str, Any], start_time: float) -> Optional[bool]:
+        """Log a terminal phase status; returns None while the phase is still going."""
+        status = status_data.get('status', 'unknown')
+        
+        if status == 'completed':
+            elapsed = time.monotonic() - start_time
+            logger.info(f"✅ Phase {phase} completed successfully in {elapsed:.1f} seconds")
+            
+            # Show additional info if available
+            if 'result' in status_data:
+                result = status_data['result']
+                if 'statistics' in result:
+                    stats = result['statistics']
+                    logger.info(f"   📊 Results: {stats}")
+            
+            return True
+        
+        if status == 'failed':
+            logger.error(f"❌ Phase {phase} failed")
+            if 'error' in status_data:
+                logger.error(f"   Error: {status_data['error']}")
+            return False
+        
+        return None
+    
+    def _wait_via_websocket(self, phase: int, timeout: int) -> Optional[bool]:
+        """Follow phase status over a WebSocket.
+        
+        Returns None when WebSockets are unavailable (missing dependency, 404/426
+        handshake, dropped connection) so the caller can poll instead.
+        """
+        if ws_connect is None:
+            return None
+        
+        ws_url = self.base_url.replace("http", "ws", 1) + f"/api/match/phase{phase}/ws"
+        start_time = time.monotonic()
+        try:
+            with ws_connect(ws_url, open_timeout=5) as ws:
+                while True:
+                    remaining = timeout - (time.monotonic() - start_time)
+                    if remaining <= 0:
+                        logger.error(f"❌ Phase {phase} timed out after {timeout} seconds")
+                        return False
+                    try:
+                        message = ws.recv(timeout=remaining)
+                    except TimeoutError:
+                        continue
+                    try:
+                        status_data = json_loads(message)
+                    except ValueError:
+                        # Heartbeats and free-form messages are not status frames
+                        continue
+                    if not isinstance(status_data, dict):
+                        continue
+
+                    outcome = self._finished_phase_outcome(phase, status_data, start_time)
+                    if outcome is not None:
+                        return outcome
+        except (OSError, InvalidHandshake, ConnectionClosed) as e:
+            logger.debug(f"WebSocket status unavailable for phase {phase}: {e}")
+            return None
+    
+    def _wait_via_events(self, phase: int, timeout: int) -> Optional[bool]:
+        """Follow phase status over a Server-Sent Events stream.
+        
+        Returns None when the backend has no events endpoint or the stream
+        breaks, so the caller can poll instead.
+        """
+        start_time = time.monotonic()
+        try:
+            with self.session.get(
+                f"{self.base_url}/api/match/phase{phase}/events",
+                stream=True,
+                timeout=(5, timeout)
+            ) as response:
+                if response.status_code != 200:
+                    # Drain the short error body so the socket goes back to the pool for polling
+                    response.content
+                    return None
+                
+                for line in response.iter_lines():
+                    if not line.startswith(b'data:'):
+                        continue
+                    try:
+                        status_data = json_loads(line[5:])
+                    except ValueError:
+                        # Free-form progress messages are not status frames
+                        continue
+                    if not isinstance(status_data, dict):
+                        continue
+                    
+                    outcome = self._finished_phase_outcome(phase, status_data, start_time)
+                    if outcome is not None:
+                        return outcome
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Event stream unavailable for phase {phase}: {e}")
+        return None
+    
     def run_phase(self, phase: int, timeout: int = 300) -> bool:
         """Run a specific matching phase and wait for completion."""
         phase_names = {1: "Individual-Problem Matching", 2: "Team Formation", 3: "Team-Problem Assignment"}
@@ -279,47 +689,66 @@ class MatchmakingTester:
                 logger.error(f"Response: {response.text}")
                 return False
             
-            # Wait for completion
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            # Prefer pushed status updates when the backend offers a WebSocket
+            ws_outcome = self._wait_via_websocket(phase, timeout)
+            if ws_outcome is not None:
+                return ws_outcome
+            
+            # Then a Server-Sent Events stream on the pooled session
+            sse_outcome = self._wait_via_events(phase, timeout)
+            if sse_outcome is not None:
+                return sse_outcome
+            
+            # Wait for completion. Servers that support long-polling hold the
+            # request until the state changes and tag each response with an ETag;
+            # without one we fall back to short-polling with exponential backoff.
+            start_time = time.monotonic()
+            deadline = start_time + timeout
+            etag = None
+            delay = POLL_INITIAL_DELAY
+            while True:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                long_polling = False
                 try:
-                    status_response = self.session.get(f"{self.base_url}/api/match/phase{phase}/status")
-                    if status_response.status_code == 200:
-                        status_data = status_response.json()
+                    params = {"wait": LONG_POLL_WAIT}
+                    if etag:
+                        params["since"] = etag
+                    status_response = self.session.get(
+                        f"{self.base_url}/api/match/phase{phase}/status",
+                        params=params,
+                        timeout=LONG_POLL_WAIT + 5
+                    )
+                    if status_response.headers.get("ETag"):
+                        long_polling = True
+                        etag = status_response.headers["ETag"]
+                    
+                    if status_response.status_code == 304:
+                        # Long-poll window elapsed without a state change
+                        continue
+                    elif status_response.status_code == 200:
+                        status_data = json_loads(status_response.content)
                         status = status_data.get('status', 'unknown')
                         
-                        if status == 'completed':
-                            elapsed = time.time() - start_time
-                            logger.info(f"✅ Phase {phase} completed successfully in {elapsed:.1f} seconds")
-                            
-                            # Show additional info if available
-                            if 'result' in status_data:
-                                result = status_data['result']
-                                if 'statistics' in result:
-                                    stats = result['statistics']
-                                    logger.info(f"   📊 Results: {stats}")
-                            
-                            return True
-                            
-                        elif status == 'failed':
-                            logger.error(f"❌ Phase {phase} failed")
-                            if 'error' in status_data:
-                                logger.error(f"   Error: {status_data['error']}")
-                            return False
-                            
+                        outcome = self._finished_phase_outcome(phase, status_data, start_time)
+                        if outcome is not None:
+                            return outcome
                         elif status in ['running', 'started']:
-                            logger.info(f"   ⏳ Phase {phase} running... ({time.time() - start_time:.1f}s elapsed)")
-                            time.sleep(5)
+                            logger.info("   ⏳ Phase %d running... (%.1fs elapsed)", phase, now - start_time)
+                            if not long_polling:
+                                time.sleep(delay)
+                                delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
                         else:
                             logger.warning(f"   ⚠️  Unknown status: {status}")
-                            time.sleep(2)
+                            time.sleep(min(delay, 1.0))
                     else:
                         logger.warning(f"   ⚠️  Status check failed: HTTP {status_response.status_code}")
-                        time.sleep(2)
+                        time.sleep(min(delay, 1.0))
                         
                 except requests.exceptions.RequestException as e:
                     logger.warning(f"   ⚠️  Status check error: {e}")
-                    time.sleep(2)
+                    time.sleep(min(delay, 1.0))
             
             logger.error(f"❌ Phase {phase} timed out after {timeout} seconds")
             return False
@@ -329,11 +758,15 @@ class MatchmakingTester:
             return False
     
     def get_results_summary(self) -> Optional[Dict[str, Any]]:
-        """Get final results summary."""
+        """Get final results summary.
+        
+        Asks for server-side aggregates only; a backend that ignores the
+        ``summary`` flag returns the full results, which are summarized locally.
+        """
         try:
-            response = self.session.get(f"{self.base_url}/api/match/results")
+            response = self.session.get(f"{self.base_url}/api/match/results", params={"summary": 1})
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 logger.warning(f"⚠️  Could not get results: HTTP {response.status_code}")
                 return None
@@ -356,26 +789,35 @@ class MatchmakingTester:
             if 'completion_rate' in summary:
                 logger.info(f"✅ Completion Rate: {summary['completion_rate']:.1%}")
         
-        if 'teams' in results:
+        if 'aggregates' in results:
+            aggregates = results['aggregates']
+            if aggregates.get('avg_team_size') is not None:
+                logger.info(f"📏 Average Team Size: {aggregates['avg_team_size']:.1f}")
+            if aggregates.get('avg_diversity') is not None:
+                logger.info(f"🌈 Average Diversity Score: {aggregates['avg_diversity']:.2f}")
+            if aggregates.get('avg_skills') is not None:
+                logger.info(f"🛠️  Average Skills Coverage: {aggregates['avg_skills']:.2f}")
+        elif 'teams' in results:
             teams = results['teams']
             if teams:
-                avg_size = sum(len(team.get('members', [])) for team in teams) / len(teams)
-                logger.info(f"📏 Average Team Size: {avg_size:.1f}")
-                
-                # Team quality metrics
-                team_scores = []
+                # Single pass over the teams for size and quality averages
+                size_sum = 0
+                diversity_sum = 0
+                skills_sum = 0
+                scored = 0
                 for team in teams:
-                    if 'ai_scores' in team:
-                        scores = team['ai_scores']
-                        diversity = scores.get('diversity_score', 0)
-                        skills = scores.get('skills_coverage', 0) 
-                        team_scores.append((diversity, skills))
+                    size_sum += len(team.get('members', []))
+                    scores = team.get('ai_scores')
+                    if scores is not None:
+                        diversity_sum += scores.get('diversity_score', 0)
+                        skills_sum += scores.get('skills_coverage', 0)
+                        scored += 1
+                
+                logger.info(f"📏 Average Team Size: {size_sum / len(teams):.1f}")
                 
-                if team_scores:
-                    avg_diversity = sum(score[0] for score in team_scores) / len(team_scores)
-                    avg_skills = sum(score[1] for score in team_scores) / len(team_scores)
-                    logger.info(f"🌈 Average Diversity Score: {avg_diversity:.2f}")
-                    logger.info(f"🛠️  Average Skills Coverage: {avg_skills:.2f}")
+                if scored:
+                    logger.info(f"🌈 Average Diversity Score: {diversity_sum / scored:.2f}")
+                    logger.info(f"🛠️  Average Skills Coverage: {skills_sum / scored:.2f}")
         
         logger.info("=" * 50)
         logger.info("🎉 Matchmaking process completed successfully!")
@@ -410,95 +852,103 @@ Template files are available in the templates/ directory.
                        help='Timeout per phase in seconds (default: 300)')
     parser.add_argument('--skip-clear', action='store_true',
                        help='Skip clearing existing database data')
+    parser.add_argument('--assume-clean', action='store_true',
+                       help='Treat the database as already empty (implies --skip-clear)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Only load data, skip running matching phases')
     parser.add_argument('--manual-docker', action='store_true',
                        help='Skip automatic Docker startup (manage Docker services manually)')
+    parser.add_argument('--compose-file', action='append', dest='compose_files',
+                       help='Compose file passed to docker compose -f (repeatable, e.g. '
+                            '--compose-file docker-compose.yml --compose-file compose.ci.yml)')
+    parser.add_argument('--compress-uploads', nargs='?', const='gzip', choices=['gzip'],
+                       help='Compress upload bodies with gzip (the backend inflates them)')
+    parser.add_argument('--concurrency', type=int, default=UPLOAD_WORKERS,
+                       help=f'Concurrent uploads when the batch endpoints are unavailable '
+                            f'(default: {UPLOAD_WORKERS}, max: {POOL_MAXSIZE})')
     
     args = parser.parse_args()
     
-    # Initialize tester
-    tester = MatchmakingTester(args.base_url)
-    
-    # Handle Docker services
-    if args.manual_docker:
-        # Manual Docker mode - just check if services are running
-        logger.info("🐳 Manual Docker mode - checking if services are running...")
-        if not tester.check_backend_health():
-            logger.error("❌ Backend services are not running.")
-            logger.error("   Please start them manually: docker compose up --build")
-            sys.exit(1)
-        logger.info("✅ Backend services are running")
-    else:
-        # Automatic Docker mode - check Docker availability and start services
-        if not tester.check_docker_available():
-            sys.exit(1)
-        
-        # Start services (will check if already running first)
-        if not tester.start_services():
-            logger.error("❌ Failed to start backend services")
-            sys.exit(1)
-    
-    try:
-        # Clear database (unless skipped)
-        if not args.skip_clear:
-            if not tester.clear_database():
+    # Initialize tester; the session and its keep-alive pool live for the whole run
+    with MatchmakingTester(args.base_url, upload_workers=args.concurrency,
+                           compress_uploads=args.compress_uploads,
+                           compose_files=args.compose_files) as tester:
+        # Handle Docker services
+        if args.manual_docker:
+            # Manual Docker mode - just check if services are running
+            logger.info("🐳 Manual Docker mode - checking if services are running...")
+            if not tester.cached_backend_health():
+                logger.error("❌ Backend services are not running.")
+                logger.error("   Please start them manually: docker compose up --build")
+                sys.exit(1)
+            logger.info("✅ Backend services are running")
+        else:
+            # Automatic Docker mode - check Docker availability and start services
+            if not tester.check_docker_available():
+                sys.exit(1)
+            
+            # Start services (will check if already running first)
+            if not tester.start_services():
+                logger.error("❌ Failed to start backend services")
                 sys.exit(1)
         
-        # Load data files
-        participants = tester.load_json_file(args.participants)
-        problems = tester.load_json_file(args.problems)
-        
-        # Basic validation
-        if len(participants) == 0:
-            logger.error("❌ No participants found in file")
-            sys.exit(1)
-        
-        if len(problems) == 0:
-            logger.error("❌ No problems found in file")
-            sys.exit(1)
-        
-        # Upload data
-        if not tester.upload_participants(participants):
-            sys.exit(1)
-        
-        if not tester.upload_problems(problems):
+        try:
+            # Clear database (unless skipped)
+            if not (args.skip_clear or args.assume_clean):
+                if not tester.clear_database():
+                    sys.exit(1)
+            
+            # Load data files
+            participants = tester.load_json_file(args.participants)
+            problems = tester.load_json_file(args.problems)
+            
+            # Basic validation
+            if len(participants) == 0:
+                logger.error("❌ No participants found in file")
+                sys.exit(1)
+            
+            if len(problems) == 0:
+                logger.error("❌ No problems found in file")
+                sys.exit(1)
+            
+            # Upload data
+            if not tester.upload_all(participants, problems):
+                sys.exit(1)
+            
+            # Skip matching phases if dry run
+            if args.dry_run:
+                logger.info("🏃‍♂️ Dry run completed - data loaded successfully")
+                sys.exit(0)
+            
+            # Run matching phases
+            total_start = time.monotonic()
+            
+            phases_success = True
+            for phase in [1, 2, 3]:
+                if not tester.run_phase(phase, args.timeout):
+                    phases_success = False
+                    break
+            
+            if not phases_success:
+                logger.error("❌ Matching phases failed")
+                sys.exit(1)
+            
+            total_elapsed = time.monotonic() - total_start
+            logger.info(f"🏁 All phases completed in {total_elapsed:.1f} seconds")
+            
+            # Get and display results
+            results = tester.get_results_summary()
+            if results:
+                tester.print_results_summary(results)
+            
+            logger.info("✨ Matchmaking test completed successfully!")
+            
+        except KeyboardInterrupt:
+            logger.info("\n⏹️  Test interrupted by user")
             sys.exit(1)
-        
-        # Skip matching phases if dry run
-        if args.dry_run:
-            logger.info("🏃‍♂️ Dry run completed - data loaded successfully")
-            sys.exit(0)
-        
-        # Run matching phases
-        total_start = time.time()
-        
-        phases_success = True
-        for phase in [1, 2, 3]:
-            if not tester.run_phase(phase, args.timeout):
-                phases_success = False
-                break
-        
-        if not phases_success:
-            logger.error("❌ Matching phases failed")
+        except Exception as e:
+            logger.error(f"❌ Unexpected error: {e}")
             sys.exit(1)
-        
-        total_elapsed = time.time() - total_start
-        logger.info(f"🏁 All phases completed in {total_elapsed:.1f} seconds")
-        
-        # Get and display results
-        results = tester.get_results_summary()
-        if results:
-            tester.print_results_summary(results)
-        
-        logger.info("✨ Matchmaking test completed successfully!")
-        
-    except KeyboardInterrupt:
-        logger.info("\n⏹️  Test interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        sys.exit(1)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.config import ALLOWED_ROLES, ALLOWED_SKILLS
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json parses the fixtures the same way
+    import json
+
+    json_loads = json.loads
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def fixtures():
+    """
+    Loader for the JSON files in tests/fixtures, parsing each file once per
+    session. The parsed payloads are shared, so tests must not mutate them.
+    """
+    cache = {}
+
+    def load(name: str):
+        if name not in cache:
+            cache[name] = json_loads((FIXTURE_DIR / name).read_bytes())
+        return cache[name]
+
+    return load
+
+
+@pytest.fixture(scope="session")
+def participant_factory():
+    """
+    Builder for seeded synthetic participant records, as the matching code
+    reads them from MongoDB. Roles and skills may be empty and every fifth
+    participant has no motivation embedding. Each call returns fresh dicts.
+    """
+    def build(count: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        participants = []
+        for i in range(count):
+            participant = {
+                "_id": f"p{i}",
+                "name": f"Participant {i}",
+                "primary_roles": [
+                    str(role) for role in rng.choice(ALLOWED_ROLES, size=rng.integers(0, 3), replace=False)
+                ],
+                "enriched_skills": {
+                    str(skill): {"mean": float(rng.uniform(0, 5))}
+                    for skill in rng.choice(ALLOWED_SKILLS, size=rng.integers(0, 5), replace=False)
+                },
+                "availability_hours": int(rng.integers(0, 40)),
+                "motivation_text": "x" * int(rng.integers(0, 200)),
+            }
+            if i % 5 != 0:
+                participant["motivation_embedding"] = rng.normal(size=4).tolist()
+            participants.append(participant)
+        return participants
+
+    return build
@@ -0,0 +1,88 @@
+import pytest
+
+import numpy as np
+
+from app.scoring.bayes import SkillPosterior, SkillPosteriorBank
+
+pytestmark = pytest.mark.unit
+
+
+def test_uniform_prior():
+    posterior = SkillPosterior()
+    assert posterior.mean == pytest.approx(0.5)
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        SkillPosterior(alpha=0.0)
+    with pytest.raises(ValueError):
+        posterior = SkillPosterior()
+        posterior.update_from_self_rating(6)
+
+
+@pytest.mark.parametrize("rating", range(6))
+def test_from_rating_fast_matches_update(rating):
+    expected = SkillPosterior()
+    expected.update_from_self_rating(rating)
+
+    posterior = SkillPosterior.from_rating_fast(rating)
+
+    assert posterior.alpha == expected.alpha
+    assert posterior.beta == expected.beta
+    assert posterior.mean == pytest.approx(expected.mean)
+    assert posterior.std_dev == pytest.approx(expected.std_dev)
+
+
+def test_parameters_are_read_only():
+    posterior = SkillPosterior(alpha=2.0, beta=3.0)
+    assert posterior.mean == pytest.approx(0.4)
+    with pytest.raises(AttributeError):
+        posterior.alpha = 10.0
+    posterior.update(successes=3, failures=0)
+    assert posterior.mean == pytest.approx(5 / 8)
+
+
+def test_posterior_convergence():
+    posterior = SkillPosterior()
+    initial_std = posterior.std_dev
+    posterior.update(successes=40, failures=10)
+    assert posterior.mean == pytest.approx(41 / 52)
+    assert posterior.std_dev < initial_std
+
+
+def test_bank_matches_scalar_posteriors():
+    ratings = np.array([[0, 3, 5], [2, 4, 1]])
+    bank = SkillPosteriorBank.from_ratings(ratings)
+    bank.update(successes=np.array([1, 0, 2]), failures=1)
+
+    for i in range(ratings.shape[0]):
+        for j in range(ratings.shape[1]):
+            expected = SkillPosterior()
+            expected.update_from_self_rating(int(ratings[i, j]))
+            expected.update(successes=[1, 0, 2][j], failures=1)
+
+            assert bank.posterior(i, j).alpha == expected.alpha
+            assert bank.posterior(i, j).beta == expected.beta
+            assert bank.mean[i, j] == pytest.approx(expected.mean)
+            assert bank.std_dev[i, j] == pytest.approx(expected.std_dev)
+
+
+def test_bank_invalid_updates():
+    bank = SkillPosteriorBank(2, 2)
+    with pytest.raises(ValueError):
+        bank.update(successes=-1, failures=0)
+    with pytest.raises(ValueError):
+        bank.update_from_self_ratings(np.array([[1, 6], [0, 0]]))
+
+
+def test_bank_posterior_is_a_live_view():
+    bank = SkillPosteriorBank.from_ratings(np.array([[1, 4]]))
+    view = bank.posterior(0, 1)
+
+    view.update_from_self_rating(5)
+    assert bank.alpha[0, 1] == 10.0
+    assert bank.beta[0, 1] == 2.0
+
+    bank.update(successes=np.array([0, 2]), failures=0)
+    assert view.alpha == 12.0
+    assert view.mean == pytest.approx(12 / 14)
@@ -0,0 +1,89 @@
+import gzip
+
+import pytest
+
+from app.utils.compression import GzipRequestMiddleware
+
+
+async def _call(middleware, headers, chunks):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": headers}
+    await middleware(scope, receive, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_gzip_request_body_is_inflated():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["headers"] = dict(scope["headers"])
+        seen["body"] = (await receive())["body"]
+
+    body = gzip.compress(b'{"items": []}')
+    await _call(
+        GzipRequestMiddleware(app),
+        [(b"content-encoding", b"gzip"), (b"content-length", str(len(body)).encode())],
+        [body[:5], body[5:]],
+    )
+
+    assert seen["body"] == b'{"items": []}'
+    assert b"content-encoding" not in seen["headers"]
+    assert seen["headers"][b"content-length"] == b"13"
+
+
+@pytest.mark.asyncio
+async def test_malformed_gzip_body_is_rejected():
+    async def app(scope, receive, send):
+        raise AssertionError("app should not be called")
+
+    sent = await _call(GzipRequestMiddleware(app), [(b"content-encoding", b"gzip")], [b"not gzip"])
+
+    assert sent[0]["status"] == 400
+
+
+@pytest.mark.asyncio
+async def test_oversized_inflated_body_is_rejected():
+    async def app(scope, receive, send):
+        raise AssertionError("app should not be called")
+
+    # ~1 MB of zeros compresses to about a kilobyte
+    bomb = gzip.compress(b"\0" * (1024 * 1024))
+    sent = await _call(GzipRequestMiddleware(app, max_body_size=4096), [(b"content-encoding", b"gzip")], [bomb])
+
+    assert sent[0]["status"] == 413
+
+
+@pytest.mark.asyncio
+async def test_multi_member_gzip_body_at_the_limit():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["body"] = (await receive())["body"]
+
+    body = gzip.compress(b"a" * 10) + gzip.compress(b"b" * 6)
+    await _call(GzipRequestMiddleware(app, max_body_size=16), [(b"content-encoding", b"gzip")], [body[:7], body[7:]])
+
+    assert seen["body"] == b"a" * 10 + b"b" * 6
+
+
+@pytest.mark.asyncio
+async def test_truncated_gzip_body_is_rejected():
+    async def app(scope, receive, send):
+        raise AssertionError("app should not be called")
+
+    body = gzip.compress(b'{"items": []}')
+    sent = await _call(GzipRequestMiddleware(app), [(b"content-encoding", b"gzip")], [body[:-4]])
+
+    assert sent[0]["status"] == 400
@@ -1,49 +1,151 @@
 import pytest
 import numpy as np
 from app.matching.cost import (
+    DEFAULT_WEIGHTS,
+    SkillVocab,
+    compute_cost_matrix,
+    compute_individual_cost,
     calculate_skill_gap_cost,
     calculate_role_alignment_cost,
     calculate_motivation_similarity_cost,
     calculate_ambiguity_fit_cost,
     calculate_workload_fit_cost,
+    normalize_embedding,
 )
 
-# Mock data
-PARTICIPANT_SKILLS = {"Python": 0.8, "JavaScript": 0.6}
-PROBLEM_SKILLS = {"Python": 0.9, "SQL": 0.7}
-PARTICIPANT_ROLES = {"backend_dev": 1.0, "data_scientist": 1.0} # Assuming weights for role alignment
-PROBLEM_ROLES = {"backend_dev": 0.6, "frontend_dev": 0.4}
-P_EMBEDDING = np.array([0.1, 0.2, 0.3])
-Q_EMBEDDING = np.array([0.4, 0.5, 0.6])
-P_TOLERANCE = 0.7
-Q_AMBIGUITY = 0.4
-P_AVAILABILITY = 30
-Q_HOURS = 32
-
-def test_skill_gap_cost():
+pytestmark = pytest.mark.unit
+
+# Mock data, built once per module with embeddings already in ndarray form
+@pytest.fixture(scope="module")
+def participant():
+    return {
+        "skills": {"Python": 0.8, "JavaScript": 0.6},
+        "role_preferences": {"backend_dev": 1.0, "data_scientist": 1.0}, # Assuming weights for role alignment
+        "motivation_embedding": np.array([0.1, 0.2, 0.3], dtype=np.float32),
+        "ambiguity_tolerance": 0.7,
+        "hours_per_week": 30,
+    }
+
+@pytest.fixture(scope="module")
+def problem():
+    return {
+        "required_skills": {"Python": 0.9, "SQL": 0.7},
+        "role_preferences": {"backend_dev": 0.6, "frontend_dev": 0.4},
+        "motivation_embedding": np.array([0.4, 0.5, 0.6], dtype=np.float32),
+        "expected_ambiguity": 0.4,
+        "expected_hours_per_week": 32,
+    }
+
+def test_skill_gap_cost(participant, problem):
     # Python gap: 0.9 - 0.8 = 0.1
     # SQL gap: 0.7 - 0.0 = 0.7
     # Mean gap: (0.1 + 0.7) / 2 = 0.4
-    cost = calculate_skill_gap_cost(PARTICIPANT_SKILLS, PROBLEM_SKILLS)
+    cost = calculate_skill_gap_cost(participant["skills"], problem["required_skills"])
     assert cost == pytest.approx(0.4, abs=1e-6)
 
-def test_role_alignment_cost():
+def test_role_alignment_cost(participant, problem):
     # Alignment: backend_dev (0.6 * 1.0) + data_scientist (0.0 * 1.0) = 0.6
     # Cost (1 - alignment): 1.0 - 0.6 = 0.4
-    cost = calculate_role_alignment_cost(PARTICIPANT_ROLES, PROBLEM_ROLES)
+    cost = calculate_role_alignment_cost(participant["role_preferences"], problem["role_preferences"])
     assert cost == pytest.approx(0.4, abs=1e-6)
 
-def test_motivation_similarity_cost():
+def test_motivation_similarity_cost(participant, problem):
     # Cosine distance between [0.1, 0.2, 0.3] and [0.4, 0.5, 0.6] is approx 0.025
-    cost = calculate_motivation_similarity_cost(P_EMBEDDING, Q_EMBEDDING)
+    cost = calculate_motivation_similarity_cost(participant["motivation_embedding"], problem["motivation_embedding"])
     assert cost == pytest.approx(0.02537, abs=1e-4)
 
-def test_ambiguity_fit_cost():
+@pytest.mark.parametrize("dim", [4, 16, 17])
+def test_motivation_similarity_cost_lists_match_arrays(dim):
+    rng = np.random.default_rng(dim)
+    u, v = rng.normal(size=dim), rng.normal(size=dim)
+
+    expected = calculate_motivation_similarity_cost(u, v)
+    assert calculate_motivation_similarity_cost(u.tolist(), v.tolist()) == pytest.approx(expected, abs=1e-12)
+    assert calculate_motivation_similarity_cost([0.0] * dim, v.tolist()) == 1.0
+
+def test_ambiguity_fit_cost(participant, problem):
     # Mismatch: |0.7 - 0.4| = 0.3
-    cost = calculate_ambiguity_fit_cost(P_TOLERANCE, Q_AMBIGUITY)
+    cost = calculate_ambiguity_fit_cost(participant["ambiguity_tolerance"], problem["expected_ambiguity"])
     assert cost == pytest.approx(0.3, abs=1e-6)
 
-def test_workload_fit_cost():
+def test_workload_fit_cost(participant, problem):
     # Required: 32h, Available: 30h. Mismatch: (32-30)/40 = 0.05
-    cost = calculate_workload_fit_cost(P_AVAILABILITY, Q_HOURS)
+    cost = calculate_workload_fit_cost(participant["hours_per_week"], problem["expected_hours_per_week"])
     assert cost == pytest.approx(0.05, abs=1e-6)
+
+def test_individual_cost_motivation_only(participant, problem):
+    weights = {**{term: 0.0 for term in DEFAULT_WEIGHTS}, "motivation_similarity": 1.0}
+    cost = compute_individual_cost(participant, problem, weights)
+    assert cost == pytest.approx(0.02537, abs=1e-4)
+
+def test_individual_cost_weights_terms(participant, problem):
+    # 0.35 * 0.4 + 0.20 * 0.4 + 0.15 * 0.02537 + 0.20 * 0.3 + 0.10 * 0.05
+    cost = compute_individual_cost(participant, problem)
+    assert cost == pytest.approx(0.28881, abs=1e-4)
+
+def _scalar_cost(participant, problem, weights):
+    return (
+        weights["skill_gap"] * calculate_skill_gap_cost(participant["skills"], problem["required_skills"])
+        + weights["role_alignment"] * calculate_role_alignment_cost(participant["role_preferences"], problem["role_preferences"])
+        + weights["motivation_similarity"] * calculate_motivation_similarity_cost(participant["motivation_embedding"], problem["motivation_embedding"])
+        + weights["ambiguity_fit"] * calculate_ambiguity_fit_cost(participant["ambiguity_tolerance"], problem["expected_ambiguity"])
+        + weights["workload_fit"] * calculate_workload_fit_cost(participant["hours_per_week"], problem["expected_hours_per_week"])
+    )
+
+def test_cost_matrix_matches_scalar_terms():
+    rng = np.random.default_rng(0)
+    skills = ["Python", "SQL", "React", "AWS"]
+    roles = ["backend_dev", "frontend_dev", "data_scientist"]
+    participants = [
+        {
+            "skills": {s: float(rng.uniform(0, 5)) for s in skills if rng.random() < 0.6},
+            "role_preferences": {r: 1.0 for r in roles if rng.random() < 0.5},
+            # Mixed lengths: only equal-length pairs are compared
+            "motivation_embedding": rng.normal(size=6 if i % 3 == 0 else 8) if i % 4 else None,
+            "ambiguity_tolerance": float(rng.random()),
+            "hours_per_week": int(rng.integers(5, 40)),
+        }
+        for i in range(12)
+    ]
+    problems = [
+        {
+            "required_skills": {s: float(rng.uniform(0, 5)) for s in skills if rng.random() < 0.5},
+            "role_preferences": {r: float(rng.random()) for r in roles if rng.random() < 0.5},
+            "motivation_embedding": rng.normal(size=6 if j == 0 else 8),
+            "expected_ambiguity": float(rng.random()),
+            "expected_hours_per_week": int(rng.integers(5, 40)),
+        }
+        for j in range(5)
+    ]
+
+    matrix = compute_cost_matrix(participants, problems, DEFAULT_WEIGHTS)
+
+    assert matrix.shape == (12, 5)
+    for i, participant in enumerate(participants):
+        for j, problem in enumerate(problems):
+            p_emb, q_emb = participant["motivation_embedding"], problem["motivation_embedding"]
+            if p_emb is not None and len(p_emb) != len(q_emb):
+                # A length mismatch costs the same as a missing embedding
+                problem = {**problem, "motivation_embedding": None}
+            expected = _scalar_cost(participant, problem, DEFAULT_WEIGHTS)
+            assert matrix[i, j] == pytest.approx(expected, abs=1e-5)
+            assert compute_individual_cost(participant, problem) == pytest.approx(expected, abs=1e-5)
+
+
+def test_skill_vocab_interns_stable_columns():
+    vocab = SkillVocab(["python", "sql"])
+    assert vocab.intern("sql") == 1
+    assert vocab.intern("rust") == 2
+    assert vocab.size() == 3
+
+    vector = vocab.vector({"rust": 4.0, "python": 2.0, "unknown": 1.0})
+    assert vector.dtype == np.float32
+    assert vector.tolist() == [2.0, 0.0, 4.0]
+
+
+def test_normalized_embeddings_keep_cosine_cost(participant, problem):
+    p_unit = normalize_embedding(participant["motivation_embedding"])
+    q_unit = normalize_embedding(problem["motivation_embedding"])
+    assert np.linalg.norm(p_unit) == pytest.approx(1.0)
+    assert 1.0 - np.dot(p_unit, q_unit) == pytest.approx(0.02537, abs=1e-4)
+    assert normalize_embedding([0.0, 0.0]) == [0.0, 0.0]
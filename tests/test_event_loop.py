@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from app.db import client
+from app.worker.event_loop import get_worker_loop, run_async
+
+pytestmark = pytest.mark.unit
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_async_reuses_one_persistent_loop():
+    first = run_async(_running_loop())
+    second = run_async(_running_loop())
+
+    assert first is second is get_worker_loop()
+    assert first.is_running() and not first.is_closed()
+
+
+def test_mongo_client_is_bound_to_worker_loop():
+    loop = get_worker_loop()
+
+    assert client.get_io_loop() is loop
+    assert run_async(_running_loop()) is loop
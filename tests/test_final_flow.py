@@ -1,56 +1,62 @@
 import pytest
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 
+from app.config import STAGE_3_WEIGHTS
 from app.matching.build_team_problem_matrix import build_team_problem_matrix
+from app.matching.team_problem_cost import compute_team_problem_cost_sync, compute_team_problem_cost_matrix
+from app.matching.team_vector import TeamVector
 from app.matching.final_hungarian import (
-    solve_final_assignment,
+    solve_final_assignment_sync,
     store_final_assignments,
-    calculate_assignment_statistics,
-    validate_assignment,
+    calculate_assignment_statistics_sync,
+    validate_assignment_sync,
 )
 
-# Mock data fixtures
-@pytest.fixture
+# Read-only cost matrices shared by the solver and statistics tests
+COST_3X3 = np.array([[1, 4, 5], [2, 3, 6], [7, 8, 9]])
+COST_3X3.flags.writeable = False
+COST_2X2 = np.array([[1, 2], [3, 4]])
+COST_2X2.flags.writeable = False
+
+# Mock data fixtures: plain namespaces stand in for the Team/Problem/Participant
+# models, since the tests only read attributes from them. Nothing mutates them,
+# so they are built once per module.
+@pytest.fixture(scope="module")
 def mock_teams():
-    # Using MagicMock to simulate the Team model objects
-    teams = []
-    for i in range(3):
-        team = MagicMock()
-        team.id = f"team_{i}"
-        team.participant_ids = [f"p{i}_1", f"p{i}_2"]
-        teams.append(team)
-    return teams
-
-@pytest.fixture
+    return [
+        SimpleNamespace(id=f"team_{i}", participant_ids=[f"p{i}_1", f"p{i}_2"])
+        for i in range(3)
+    ]
+
+@pytest.fixture(scope="module")
 def mock_problems():
-    # Using MagicMock to simulate the Problem model objects
-    problems = []
-    for i in range(3):
-        problem = MagicMock()
-        problem.id = f"problem_{i}"
-        problem.required_skills = {"skill1": 4}
-        problem.role_preferences = {"role1": 1.0}
-        problem.expected_ambiguity = 0.5
-        problem.expected_hours_per_week = 20
-        problem.problem_embedding = [0.1] * 10
-        problems.append(problem)
-    return problems
-
-@pytest.fixture
+    return [
+        SimpleNamespace(
+            id=f"problem_{i}",
+            required_skills={"skill1": 4},
+            role_preferences={"role1": 1.0},
+            expected_ambiguity=0.5,
+            expected_hours_per_week=20,
+            problem_embedding=[0.1] * 10,
+        )
+        for i in range(3)
+    ]
+
+@pytest.fixture(scope="module")
 def mock_participants():
-    # Using MagicMock to simulate Participant model objects
-    participants = []
-    for i in range(6):
-        p = MagicMock()
-        p.id = f"p{i // 2}_{i % 2 + 1}"
-        p.computed_skills = {"skill1": MagicMock(posterior=MagicMock(mean=4.0))}
-        p.roles = ["role1"]
-        p.availability = 25
-        p.motivation_embedding = [0.1] * 10
-        p.gpt_traits = MagicMock(ambiguity_tolerance=0.5)
-        participants.append(p)
-    return participants
+    return [
+        SimpleNamespace(
+            id=f"p{i // 2}_{i % 2 + 1}",
+            computed_skills={"skill1": SimpleNamespace(posterior=SimpleNamespace(mean=4.0))},
+            roles=["role1"],
+            availability=25,
+            motivation_embedding=[0.1] * 10,
+            gpt_traits=SimpleNamespace(ambiguity_tolerance=0.5),
+        )
+        for i in range(6)
+    ]
 
 @pytest.mark.asyncio
 @patch("app.matching.build_team_problem_matrix.get_all_final_teams")
@@ -71,19 +77,88 @@ async def test_build_matrix_end_to_end(
     assert len(problem_map) == 3
     assert not np.any(cost_matrix == 1e6) # No padding costs
 
-@pytest.mark.asyncio
-async def test_solve_assignment():
-    cost_matrix = np.array([[1, 4, 5], [2, 3, 6], [7, 8, 9]])
+def test_team_problem_cost_matrix_matches_scalar(mock_problems):
+    team_vectors = [
+        TeamVector(
+            team_id=f"team_{i}",
+            avg_skill_levels={"skill1": 2.0 + i, "skill2": 1.0},
+            role_weights={"role1": 0.5 * i, "role2": 1.0 - 0.5 * i},
+            min_availability=10 + 10 * i,
+            avg_motivation_embedding=[0.1 * (i + 1)] * 5 + [0.3] * 5,
+            avg_communication_style=0.5,
+            avg_ambiguity_tolerance=0.2 * i,
+            avg_confidence_score=0.6,
+        )
+        for i in range(3)
+    ]
+    problems = mock_problems + [
+        SimpleNamespace(
+            id="problem_x",
+            required_skills={"skill2": 3.0, "skill3": 5.0},
+            role_preferences={"role2": 0.7},
+            expected_ambiguity=0.9,
+            expected_hours_per_week=30,
+            problem_embedding=None,
+        )
+    ]
+
+    matrix = compute_team_problem_cost_matrix(team_vectors, problems, STAGE_3_WEIGHTS)
+
+    assert matrix.shape == (3, 4)
+    for i, team_vector in enumerate(team_vectors):
+        for j, problem in enumerate(problems):
+            expected = compute_team_problem_cost_sync(team_vector, problem, STAGE_3_WEIGHTS)
+            assert matrix[i, j] == pytest.approx(expected, abs=1e-6)
+
+@patch("app.matching.team_problem_cost.calculate_motivation_similarity_cost")
+def test_zero_weight_term_is_skipped(mock_similarity, mock_problems):
+    team_vector = TeamVector(
+        team_id="team_0",
+        avg_skill_levels={"skill1": 3.0},
+        role_weights={"role1": 1.0},
+        min_availability=20,
+        avg_motivation_embedding=[0.2] * 10,
+        avg_communication_style=0.5,
+        avg_ambiguity_tolerance=0.5,
+        avg_confidence_score=0.6,
+    )
+    weights = dict(STAGE_3_WEIGHTS, motivation_similarity=0.0)
+
+    cost = compute_team_problem_cost_sync(team_vector, mock_problems[0], weights)
+
+    mock_similarity.assert_not_called()
+    assert cost == pytest.approx(compute_team_problem_cost_matrix([team_vector], mock_problems[:1], weights)[0, 0])
+
+def test_team_vector_embedding_array_follows_field():
+    team_vector = TeamVector(
+        team_id="team_0",
+        avg_skill_levels={},
+        role_weights={},
+        min_availability=20,
+        avg_motivation_embedding=[1.0, 2.0],
+        avg_communication_style=0.5,
+        avg_ambiguity_tolerance=0.5,
+        avg_confidence_score=0.6,
+    )
+    first = team_vector.motivation_embedding_array
+    assert team_vector.motivation_embedding_array is first
+
+    copied = team_vector.model_copy(update={"avg_motivation_embedding": [3.0, 4.0]})
+    assert copied.motivation_embedding_array.tolist() == [3.0, 4.0]
+
+    team_vector.avg_motivation_embedding = [9.0]
+    assert team_vector.motivation_embedding_array.tolist() == [9.0]
+
+def test_solve_assignment():
     team_map = {0: "t0", 1: "t1", 2: "t2"}
     problem_map = {0: "p0", 1: "p1", 2: "p2"}
 
-    mapping, total_cost = await solve_final_assignment(cost_matrix, team_map, problem_map)
+    mapping, total_cost = solve_final_assignment_sync(COST_3X3, team_map, problem_map)
 
     assert total_cost == 1 + 3 + 9
     assert mapping == {"p0": "t0", "p1": "t1", "p2": "t2"}
 
-@pytest.mark.asyncio
-async def test_uneven_teams_problems():
+def test_uneven_teams_problems():
     cost_matrix = np.array([
         [1, 8, 1e6],
         [2, 3, 1e6]
@@ -91,30 +166,27 @@ async def test_uneven_teams_problems():
     team_map = {0: "t0", 1: "t1"}
     problem_map = {0: "p0", 1: "p1"}
 
-    mapping, total_cost = await solve_final_assignment(cost_matrix, team_map, problem_map)
+    mapping, total_cost = solve_final_assignment_sync(cost_matrix, team_map, problem_map)
     assert len(mapping) == 2
     assert "p0" in mapping
     assert "p1" in mapping
 
-@pytest.mark.asyncio
-async def test_validation_logic():
+def test_validation_logic():
     valid_map = {"p0": "t0", "p1": "t1"}
     invalid_map = {"p0": "t0", "p1": "t0"}
     
-    res_valid = await validate_assignment(valid_map)
+    res_valid = validate_assignment_sync(valid_map)
     assert res_valid["is_valid"]
     
-    res_invalid = await validate_assignment(invalid_map)
+    res_invalid = validate_assignment_sync(invalid_map)
     assert not res_invalid["is_valid"]
 
-@pytest.mark.asyncio
-async def test_stats_calculation():
-    cost_matrix = np.array([[1, 2], [3, 4]])
+def test_stats_calculation():
     team_map = {0: "t0", 1: "t1"}
     problem_map = {0: "p0", 1: "p1"}
     assignment = {"p0": "t0", "p1": "t1"} # t0->p0 (cost 1), t1->p1 (cost 4)
 
-    stats = await calculate_assignment_statistics(assignment, cost_matrix, team_map, problem_map)
+    stats = calculate_assignment_statistics_sync(assignment, COST_2X2, team_map, problem_map)
     
     assert stats["mean_cost"] == 2.5
     assert stats["worst_case_cost"] == 4
@@ -143,9 +215,22 @@ async def test_no_teams_or_problems():
         assert not t_map
         assert not p_map
 
-@pytest.mark.asyncio
-async def test_assignment_with_padding():
+def test_assignment_with_more_problems_than_teams():
     # 2 teams, 3 problems
+    cost_matrix = np.array([
+        [1, 2, 3],
+        [4, 5, 6],
+    ])
+    team_map = {0: "t0", 1: "t1"}
+    problem_map = {0: "p0", 1: "p1", 2: "p2"}
+    
+    mapping, _ = solve_final_assignment_sync(cost_matrix, team_map, problem_map)
+    
+    # One problem is left unassigned
+    assert len(mapping) == 2
+    
+def test_assignment_with_padding():
+    # 2 teams, 3 problems, squared up with a padded row
     cost_matrix = np.array([
         [1, 2, 3],
         [4, 5, 6],
@@ -154,13 +239,12 @@ async def test_assignment_with_padding():
     team_map = {0: "t0", 1: "t1"}
     problem_map = {0: "p0", 1: "p1", 2: "p2"}
     
-    mapping, _ = await solve_final_assignment(cost_matrix, team_map, problem_map)
+    mapping, _ = solve_final_assignment_sync(cost_matrix, team_map, problem_map)
     
-    # One problem will be unassigned (matched to the fake team)
+    # The problem matched to the fake team is left out
     assert len(mapping) == 2
     
-@pytest.mark.asyncio
-async def test_empty_assignment_stats():
-    stats = await calculate_assignment_statistics({}, np.array([]), {}, {})
+def test_empty_assignment_stats():
+    stats = calculate_assignment_statistics_sync({}, np.array([]), {}, {})
     assert stats["mean_cost"] == 0
     assert stats["worst_case_cost"] == 0 
\ No newline at end of file
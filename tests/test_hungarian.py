@@ -2,13 +2,22 @@ import numpy as np
 
 from app.matching.hungarian_capacity import solve_hungarian_capacity
 
+# Shared read-only inputs; the variants add a spare, costly slot, or a dummy
+# participant and slot as padding
+SLOT_COSTS = np.array([
+    [10, 20, 5],
+    [15, 5, 25],
+    [5, 10, 20],
+])
+SLOT_COSTS.flags.writeable = False
+SLOT_COSTS_EXTRA_SLOT = np.pad(SLOT_COSTS, ((0, 0), (0, 1)), constant_values=1000)
+SLOT_COSTS_EXTRA_SLOT.flags.writeable = False
+SLOT_COSTS_PADDED = np.pad(SLOT_COSTS, ((0, 1), (0, 1)), constant_values=1000)
+SLOT_COSTS_PADDED.flags.writeable = False
+
 
 def test_hungarian_solver():
-    cost_matrix = np.array([
-        [10, 20, 5],
-        [15, 5, 25],
-        [5, 10, 20],
-    ])
+    cost_matrix = SLOT_COSTS
     participant_map = {0: "p1", 1: "p2", 2: "p3"}
     slot_map = {
         0: ("prob1", 0),
@@ -43,13 +52,27 @@ def test_hungarian_solver():
     assert "p1" in assignments["prob2"]
 
 
+def test_hungarian_solver_more_slots_than_participants():
+    cost_matrix = SLOT_COSTS_EXTRA_SLOT
+    participant_map = {0: "p1", 1: "p2", 2: "p3"}
+    slot_map = {
+        0: ("prob1", 0),
+        1: ("prob1", 1),
+        2: ("prob2", 0),
+        3: ("prob2", 1),
+    }
+
+    assignments, total_cost = solve_hungarian_capacity(
+        cost_matrix, participant_map, slot_map
+    )
+
+    assert total_cost == 15.0
+    assert len(assignments["prob1"]) == 2
+    assert len(assignments["prob2"]) == 1
+
+
 def test_hungarian_solver_padded():
-    cost_matrix = np.array([
-        [10, 20, 5, 1000],
-        [15, 5, 25, 1000],
-        [5, 10, 20, 1000],
-        [1000, 1000, 1000, 1000]
-    ])
+    cost_matrix = SLOT_COSTS_PADDED
     participant_map = {0: "p1", 1: "p2", 2: "p3"}
     slot_map = {
         0: ("prob1", 0),
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.ingest import (
+    BatchUploadRequest,
+    upload_participants_batch,
+    upload_problems_batch,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name: str):
+    with open(FIXTURES_DIR / name) as f:
+        return json.load(f)
+
+
+@pytest.mark.asyncio
+@patch("app.api.ingest.db")
+async def test_participant_batch_uses_single_insert(mock_db):
+    mock_db.participants.insert_many = AsyncMock()
+    participant = load_fixture("valid_participant_1.json")
+
+    result = await upload_participants_batch(BatchUploadRequest(items=[participant, participant]))
+
+    assert result == {"inserted": 2}
+    mock_db.participants.insert_many.assert_awaited_once()
+    documents = mock_db.participants.insert_many.await_args.args[0]
+    assert [doc["_id"] for doc in documents] == [participant["_id"]] * 2
+
+
+@pytest.mark.asyncio
+@patch("app.api.ingest.db")
+async def test_problem_batch_rejects_invalid_item_before_writing(mock_db):
+    mock_db.problems.insert_many = AsyncMock()
+    items = [load_fixture("valid_problem_1.json"), load_fixture("invalid_problem_1.json")]
+
+    with pytest.raises(HTTPException) as excinfo:
+        await upload_problems_batch(BatchUploadRequest(items=items))
+
+    assert excinfo.value.status_code == 422
+    assert excinfo.value.detail["index"] == 1
+    mock_db.problems.insert_many.assert_not_called()
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from app.matching.kmedoids import (
+    _swap_cost_reductions_kernel,
+    _swap_cost_reductions_numpy,
+    assign_to_medoids,
+    k_medoids_clustering,
+    pairwise_cost_matrix,
+)
+from app.matching.pairwise import participant_pair_cost
+
+pytestmark = pytest.mark.unit
+
+
+def test_assign_to_medoids_picks_nearest(participant_factory):
+    participants = participant_factory(12)
+    medoids = [0, 5, 9]
+
+    clusters = assign_to_medoids(participants, medoids)
+
+    assert sorted(i for cluster in clusters for i in cluster) == list(range(12))
+    for position, medoid_idx in enumerate(medoids):
+        assert medoid_idx in clusters[position]
+    for position, cluster in enumerate(clusters):
+        for i in cluster:
+            if i in medoids:
+                continue
+            costs = [participant_pair_cost(participants[i], participants[m]) for m in medoids]
+            assert costs.index(min(costs)) == position
+
+
+def test_assign_to_medoids_empty(participant_factory):
+    assert assign_to_medoids(participant_factory(3), []) == []
+
+
+def test_k_medoids_uses_precomputed_distances(participant_factory):
+    participants = participant_factory(15)
+    distances = pairwise_cost_matrix(participants)
+
+    def fail(a, b):
+        raise AssertionError("cost_function should not be called when distances are given")
+
+    medoids = k_medoids_clustering(participants, k=3, cost_function=fail, distances=distances)
+
+    assert len(set(medoids)) == 3
+    assert medoids == k_medoids_clustering(participants, k=3)
+    clusters = assign_to_medoids(participants, medoids, cost_function=fail, distances=distances)
+    assert clusters == assign_to_medoids(participants, medoids)
+
+
+def test_k_medoids_zero_distances_short_circuit(participant_factory):
+    participants = participant_factory(6)
+
+    assert k_medoids_clustering(participants, k=2, distances=np.zeros((6, 6))) == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "n,k,expected_len",
+    [(5, 5, 5), (3, 5, 3), (3, 1, 1), (1, 1, 1), (0, 2, 0)],
+    ids=["k_equals_n", "k_greater_than_n", "k_equals_one", "single_participant", "empty"],
+)
+def test_k_medoids_edge_cases(participant_factory, n, k, expected_len):
+    medoids = k_medoids_clustering(participant_factory(n), k=k)
+
+    assert len(medoids) == expected_len
+    assert len(set(medoids)) == expected_len
+    assert all(0 <= m < n for m in medoids)
+
+
+def test_swap_kernel_matches_numpy_scoring():
+    distances = np.random.default_rng(0).random((12, 12))
+    medoids = np.array([1, 4, 9])
+
+    # The kernel runs as plain Python here whether or not numba is installed
+    expected = _swap_cost_reductions_numpy(distances, medoids, 4)
+    assert np.allclose(_swap_cost_reductions_kernel(distances, medoids, 4), expected)
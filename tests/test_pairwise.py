@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from app.matching.pair_cache import cached_participant_pair_cost_matrix, pair_cost_key
+from app.matching.pairwise import (
+    _skill_overlap_penalty_kernel,
+    _skill_overlap_penalty_numpy,
+    pair_cost_cache,
+    participant_pair_cost,
+    participant_pair_cost_matrix,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_pair_cost_matrix_matches_scalar(participant_factory):
+    participants = participant_factory(25)
+    # Edge cases: zero availability on both sides, a zero embedding, a duplicate _id
+    participants[1]["availability_hours"] = 0
+    participants[2]["availability_hours"] = 0
+    participants[3]["motivation_embedding"] = [0.0, 0.0, 0.0, 0.0]
+    participants[4]["motivation_embedding"] = [0.5, 0.5, 0.5]
+    participants.append(dict(participants[6], availability_hours=39))
+
+    matrix = participant_pair_cost_matrix(participants)
+
+    assert matrix.shape == (26, 26)
+    for i, a in enumerate(participants):
+        for j, b in enumerate(participants):
+            assert matrix[i, j] == pytest.approx(participant_pair_cost(a, b), abs=1e-9)
+
+
+def test_pair_cost_matrix_empty():
+    assert participant_pair_cost_matrix([]).shape == (0, 0)
+
+
+def test_pair_cost_cache_is_scoped_and_symmetric(participant_factory):
+    a, b = participant_factory(2, seed=3)
+    expected = participant_pair_cost(a, b)
+
+    with pair_cost_cache():
+        assert participant_pair_cost(a, b) == pytest.approx(expected)
+        # Cached by _id: edits inside the block are not seen, in either order
+        changed = dict(b, availability_hours=b["availability_hours"] + 17)
+        assert participant_pair_cost(changed, a) == pytest.approx(expected)
+
+    assert participant_pair_cost(a, changed) != pytest.approx(expected)
+
+
+def test_skill_overlap_kernel_matches_numpy():
+    rng = np.random.default_rng(1)
+    present = (rng.random((30, 9)) < 0.4).astype(float)
+    levels = rng.uniform(0, 5, size=present.shape) * present
+
+    # The kernel runs as plain Python here whether or not numba is installed
+    expected = _skill_overlap_penalty_numpy(present, levels)
+    assert np.allclose(_skill_overlap_penalty_kernel(present, levels), expected)
+
+
+def test_pair_cost_matrix_is_persisted_by_content(participant_factory, tmp_path):
+    participants = participant_factory(8)
+    expected = participant_pair_cost_matrix(participants)
+
+    assert np.array_equal(cached_participant_pair_cost_matrix(participants, tmp_path), expected)
+    assert list(tmp_path.glob("*.npy")) == [tmp_path / f"{pair_cost_key(participants)}.npy"]
+    assert np.array_equal(cached_participant_pair_cost_matrix(participants, tmp_path), expected)
+
+    # Any feature edit changes the key, so a stale matrix is never read back
+    edited = participants[:3] + [dict(participants[3], availability_hours=99)] + participants[4:]
+    assert pair_cost_key(edited) != pair_cost_key(participants)
+    assert np.array_equal(
+        cached_participant_pair_cost_matrix(edited, tmp_path), participant_pair_cost_matrix(edited)
+    )
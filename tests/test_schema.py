@@ -1,38 +1,75 @@
-import json
-from pathlib import Path
+import sys
 
 import pytest
 from fastapi import HTTPException
 
-from app.utils.validate import validate_participant, validate_problem
+from app.models import Participant
 
-FIXTURE_DIR = Path(__file__).parent / "fixtures"
+from app.utils.validate import (
+    participant_fast_check,
+    participant_validator,
+    problem_fast_check,
+    problem_validator,
+    validate_participant,
+    validate_problem,
+)
 
 
-def load_fixture(name: str):
-    with open(FIXTURE_DIR / name) as f:
-        return json.load(f)
-
-
-def test_validate_valid_participant():
-    payload = load_fixture("valid_participant_1.json")
+def test_validate_valid_participant(fixtures):
+    payload = fixtures("valid_participant_1.json")
     assert validate_participant(payload) is not None
 
 
-def test_validate_invalid_participant():
-    payload = load_fixture("invalid_participant_1.json")
+def test_validate_invalid_participant(fixtures):
+    payload = fixtures("invalid_participant_1.json")
     with pytest.raises(HTTPException) as exc_info:
         validate_participant(payload)
     assert exc_info.value.status_code == 422
 
 
-def test_validate_valid_problem():
-    payload = load_fixture("valid_problem_1.json")
+def test_validate_valid_problem(fixtures):
+    payload = fixtures("valid_problem_1.json")
     assert validate_problem(payload) is not None
 
 
-def test_validate_invalid_problem():
-    payload = load_fixture("invalid_problem_1.json")
+def test_validate_invalid_problem(fixtures):
+    payload = fixtures("invalid_problem_1.json")
     with pytest.raises(HTTPException) as exc_info:
         validate_problem(payload)
-    assert exc_info.value.status_code == 422 
\ No newline at end of file
+    assert exc_info.value.status_code == 422 
+
+@pytest.mark.parametrize(
+    "name, validator, fast_check",
+    [
+        ("valid_participant_1.json", participant_validator, participant_fast_check),
+        ("invalid_participant_1.json", participant_validator, participant_fast_check),
+        ("valid_problem_1.json", problem_validator, problem_fast_check),
+        ("invalid_problem_1.json", problem_validator, problem_fast_check),
+    ],
+)
+def test_fast_check_agrees_with_jsonschema(fixtures, name, validator, fast_check):
+    payload = fixtures(name)
+    assert fast_check is not None
+    assert fast_check(payload) == validator.is_valid(payload)
+
+
+def test_fast_check_rejects_unknown_role_and_extra_keys(fixtures):
+    payload = fixtures("valid_participant_1.json")
+    assert participant_fast_check(payload)
+    assert not participant_fast_check({**payload, "primary_roles": ["astronaut"]})
+    assert not participant_fast_check({**payload, "unexpected": 1})
+    assert not participant_fast_check({**payload, "self_rated_skills": {"python": 6}})
+
+
+def test_only_known_names_are_interned(fixtures):
+    # Built at runtime so neither string starts out interned
+    known, unknown = "".join(["back", "end"]), "".join(["astro", "naut"])
+    payload = fixtures("valid_participant_1.json")
+
+    participant = Participant.model_validate(
+        {**payload, "primary_roles": [known, unknown], "self_rated_skills": {unknown: 3}}
+    )
+
+    assert participant.primary_roles[0] is sys.intern("backend")
+    assert participant.primary_roles[1] is unknown
+    assert next(iter(participant.self_rated_skills)) is unknown
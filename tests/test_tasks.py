@@ -0,0 +1,58 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.scoring.bayes import SkillPosterior
+from app.utils.validate import validate_participant
+from app.vector.problem_ingest import _parse_problem
+from app.worker.tasks import _enrich_participant, score_participant
+
+
+@patch("app.worker.tasks._enrich_participant", new_callable=MagicMock)
+@patch("app.worker.tasks.run_async", return_value=({}, [0.0]))
+def test_score_participant_matches_checked_posteriors(mock_run_async, mock_enrich, fixtures):
+    payload = fixtures("valid_participant_1.json")
+
+    enriched = score_participant.run(payload)
+
+    assert enriched["enriched_skills"].keys() == payload["self_rated_skills"].keys()
+    for skill, rating in payload["self_rated_skills"].items():
+        expected = SkillPosterior()
+        expected.update_from_self_rating(rating)
+        scored = enriched["enriched_skills"][skill]
+        assert scored["alpha"] == expected.alpha
+        assert scored["beta"] == expected.beta
+        assert scored["mean"] == pytest.approx(expected.mean)
+        assert scored["std_dev"] == pytest.approx(expected.std_dev)
+
+
+@pytest.mark.asyncio
+@patch("app.worker.tasks.pinecone_client")
+@patch("app.worker.tasks.get_embedding", new_callable=AsyncMock, return_value=None)
+@patch("app.worker.tasks.get_gpt_analysis", new_callable=AsyncMock, return_value={})
+async def test_enrich_participant_skips_missing_embedding(mock_gpt, mock_embedding, mock_pinecone, fixtures):
+    mock_pinecone.upsert_vectors = AsyncMock()
+    participant = validate_participant(fixtures("valid_participant_1.json"))
+
+    gpt_analysis, embedding = await _enrich_participant(participant)
+
+    assert gpt_analysis == {}
+    assert embedding is None
+    mock_pinecone.upsert_vectors.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.vector.problem_ingest.pinecone_client")
+@patch("app.vector.problem_ingest.get_embedding", new_callable=AsyncMock, return_value=None)
+@patch("app.vector.problem_ingest.get_problem_analysis", new_callable=AsyncMock, return_value={})
+@patch("app.vector.problem_ingest.db")
+async def test_parse_problem_skips_missing_embedding(mock_db, mock_analysis, mock_embedding, mock_pinecone, fixtures):
+    problem = fixtures("valid_problem_1.json")
+    mock_db.problems.find_one = AsyncMock(return_value=problem)
+    mock_db.problems.update_one = AsyncMock()
+    mock_pinecone.upsert_vectors = AsyncMock()
+
+    await _parse_problem(problem["_id"])
+
+    mock_db.problems.update_one.assert_not_called()
+    mock_pinecone.upsert_vectors.assert_not_called()
@@ -0,0 +1,49 @@
+import pytest
+
+from app.matching.slot_solver import (
+    calculate_all_team_coverage_metrics,
+    calculate_team_coverage_metrics,
+    solve_team_slots,
+)
+
+pytestmark = pytest.mark.unit
+
+
+# Deterministic and only read by the tests, so built once per module
+@pytest.fixture(scope="module")
+def participants_20(participant_factory):
+    return participant_factory(20)
+
+
+def test_batched_coverage_metrics_match_per_team(participants_20):
+    teams = [participants_20[i : i + 4] for i in range(0, 20, 4)]
+    teams.append([])
+
+    batched = calculate_all_team_coverage_metrics(teams)
+
+    assert len(batched) == len(teams)
+    for team, metrics in zip(teams, batched):
+        expected = calculate_team_coverage_metrics(team)
+        assert metrics.keys() == expected.keys()
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value)
+
+
+def test_batched_coverage_metrics_empty_input():
+    assert calculate_all_team_coverage_metrics([]) == []
+
+
+def test_solve_team_slots_fills_to_target_size(participants_20):
+    teams = [participants_20[0:2], participants_20[2:3], participants_20[3:7]]
+
+    completed = solve_team_slots(teams, participants_20, target_team_size=4, role_coverage_threshold=0.0)
+
+    assert [len(team) for team in completed] == [4, 4, 4]
+    ids = [member["_id"] for team in completed for member in team]
+    assert len(ids) == len(set(ids))
+    for team, original in zip(completed, teams):
+        assert team[: len(original)] == original
+
+
+def test_solve_team_slots_empty_teams(participants_20):
+    assert solve_team_slots([], participants_20) == []